@@ -0,0 +1,111 @@
+"""
+Check the automatic method selection (core/auto.py) against full solves. For every problem, epsilon and method
+each stage of the prediction is shown as predicted/actual: the Richardson estimate of the pilot's own error,
+the steps and the time of the full solve and its error (the pilot error scaled by the method's order).
+Each case ends with whether Auto picked the fastest method that actually reaches epsilon
+(global error <= epsilon × MethodSelector.error_slack).
+Run from the repository root:
+    python benchmarks/auto_selection.py [--epsilons EPS ...] [--repeats N]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core import ODESolver, RungeKuttaMethod, ReferenceSolution, MethodSelector
+from step_control import PROBLEMS
+
+MAX_ITER = 10000
+
+
+def reference_solution(function, y0: float, t0: float, t_end: float) -> ReferenceSolution:
+    """RK4 at 1e-12, well below the tightest epsilon checked"""
+    ts, ys, _ = ODESolver.solve(function, RungeKuttaMethod, 1e-12, y0, t0, t_end, max_iter=10**7)
+    dys = np.array([function(t, y) for t, y in zip(ts, ys)])
+    return ReferenceSolution(ts, ys, dys, RungeKuttaMethod.display_name, 1e-12)
+
+
+def solve_error(ts: np.ndarray, ys: np.ndarray, t_end: float, reference: ReferenceSolution) -> float:
+    """Largest error of a solve (inf if it stops before t_end)"""
+    if not np.isclose(ts[-1], t_end):
+        return np.inf
+    error = float(np.max(np.abs(ys - reference(ts))))
+    return error if np.isfinite(error) else np.inf
+
+
+def full_solve(function, method, epsilon: float, y0: float, t0: float, t_end: float,
+               reference: ReferenceSolution, repeats: int, max_iter: int = MAX_ITER) -> dict:
+    """Actual steps, time (best of repeats) and largest error of a solve"""
+    best = np.inf
+    for _ in range(repeats):
+        stats = {}
+        start = time.perf_counter()
+        ts, ys, _ = ODESolver.solve(function, method, epsilon, y0, t0, t_end, max_iter=max_iter, stats=stats)
+        best = min(best, time.perf_counter() - start)
+    return {'steps': stats['accepted_steps'], 'time': best, 'error': solve_error(ts, ys, t_end, reference)}
+
+
+def ratio(predicted: float, actual: float) -> str:
+    if not np.isfinite(predicted) and not np.isfinite(actual):
+        return "inf/inf"
+    if actual == 0 or not np.isfinite(predicted) or not np.isfinite(actual):
+        return f"{predicted:.0e}/{actual:.0e}"
+    return f"{predicted / actual:.2f}"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the automatic method selection")
+    parser.add_argument("--epsilons", type=float, nargs="+", default=[1e-2, 1e-3, 1e-4, 1e-5, 1e-6, 1e-7])
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    header = (f"{'equation':18s} {'eps':>7s} {'method':18s} {'pilot error p/a':>15s} {'steps p/a':>10s} "
+              f"{'time p/a':>10s} {'error p/a':>15s} {'reaches p/a':>11s}")
+    print(header)
+    print("-" * len(header))
+    hits, cases, time_losses, selection_times = 0, 0, [], []
+    for equation, function, y0, t0, t_end in PROBLEMS:
+        reference = reference_solution(function, y0, t0, t_end)
+        for epsilon in args.epsilons:
+            start = time.perf_counter()
+            selection = MethodSelector.select(function, epsilon, y0, t0, t_end, MAX_ITER)
+            selection_times.append(time.perf_counter() - start)
+
+            actual = {}
+            for prediction in selection.predictions:
+                method = prediction['method']
+                pilot = prediction['pilot']
+                pilot_error = full_solve(function, method, pilot['epsilon'], y0, t0, t_end, reference,
+                                         1, pilot['max_iter'])['error']
+                result = full_solve(function, method, epsilon, y0, t0, t_end, reference, args.repeats)
+                result['reaches'] = result['error'] <= epsilon * MethodSelector.error_slack
+                actual[method] = result
+                print(f"{equation:18s} {epsilon:7.0e} {method.__name__:18s} "
+                      f"{pilot['estimated_error']:7.1e}/{pilot_error:7.1e} "
+                      f"{ratio(prediction['steps'], result['steps']):>10s} "
+                      f"{ratio(prediction['predicted_time'], result['time']):>10s} "
+                      f"{prediction['predicted_error']:7.1e}/{result['error']:7.1e} "
+                      f"{'+' if prediction['reaches'] else '-'}/{'+' if result['reaches'] else '-':>9s}")
+
+            reaching = [m for m in actual if actual[m]['reaches']]
+            if reaching:
+                fastest = min(reaching, key=lambda m: actual[m]['time'])
+            else:
+                fastest = min(actual, key=lambda m: actual[m]['error'])
+            cases += 1
+            hits += selection.method is fastest
+            time_losses.append(actual[selection.method]['time'] / actual[fastest]['time'])
+            print(f"{'':18s} {'':7s} Auto: {selection.method.__name__}, fastest reaching: {fastest.__name__}"
+                  f"{'' if selection.method is fastest else '  <-- miss'}")
+
+    print(f"\nAuto picked the fastest method that reaches epsilon in {hits}/{cases} cases "
+          f"({100 * hits / cases:.0f}%); time of the pick / fastest: median {np.median(time_losses):.2f}, "
+          f"max {np.max(time_losses):.2f}; selection time: median {np.median(selection_times):.2e} s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""
+Import-time benchmark guarding startup latency of the `core` package.
+Run from the repository root:
+    python benchmarks/import_time.py [--budget SECONDS] [--repeat N]
+Exits with a non-zero status if importing `core` pulls in heavy modules
+or takes longer than the budget.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ("sympy", "matplotlib", "tkinter")
+
+_PROBE = """
+import sys, time, json
+start = time.perf_counter()
+import core
+from core import ODESolver, EulerMethod
+elapsed = time.perf_counter() - start
+ODESolver.solve(lambda t, y: t + y, EulerMethod, 1e-3, 0.0, 0.0, 1.0)
+heavy = sorted({name.split('.')[0] for name in sys.modules} & set(json.loads(sys.argv[1])))
+print(json.dumps({'elapsed': elapsed, 'heavy': heavy}))
+"""
+
+
+def measure_import(repeat: int) -> tuple[float, list[str]]:
+    """
+    Import `core` in fresh interpreters and return the best time and loaded heavy modules.
+    Args:
+        repeat: Number of fresh interpreters to start.
+    Returns:
+        Tuple (best_time, heavy_modules).
+    """
+    best, heavy = float("inf"), []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", _PROBE, json.dumps(HEAVY_MODULES)],
+            cwd=ROOT, capture_output=True, text=True, check=True
+        )
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+        best = min(best, result['elapsed'])
+        heavy = sorted(set(heavy) | set(result['heavy']))
+    return best, heavy
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark import time of the core package")
+    parser.add_argument("--budget", type=float, default=0.5, help="maximum allowed import time in seconds")
+    parser.add_argument("--repeat", type=int, default=5, help="number of fresh interpreters to start")
+    args = parser.parse_args()
+
+    best, heavy = measure_import(args.repeat)
+    print(f"import core: {best * 1000:.1f} ms (budget {args.budget * 1000:.0f} ms)")
+
+    failed = False
+    if heavy:
+        print(f"FAIL: heavy modules loaded on import: {', '.join(heavy)}")
+        failed = True
+    if best > args.budget:
+        print("FAIL: import time exceeds budget")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
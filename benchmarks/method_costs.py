@@ -0,0 +1,76 @@
+"""
+Measure per-step costs of the ODE methods and store them for the automatic method selection (core/auto.py).
+Run from the repository root:
+    python benchmarks/method_costs.py [--epsilon EPS] [--output PATH]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core import ODESolver, ode_solve_methods
+from core.auto import DEFAULT_COSTS_PATH
+from step_control import PROBLEMS
+
+
+def counting(function):
+    """f(t, y) behind the same kind of call-counting wrapper ODESolver uses when stats are requested"""
+    counters = {'rhs_evaluations': 0}
+
+    def counted(t, y):
+        counters['rhs_evaluations'] += 1
+        return function(t, y)
+    return counted
+
+
+def rhs_cost(function, t0: float, y0: float, samples: int = 2000) -> float:
+    """Average time of one RHS evaluation, in seconds"""
+    start = time.perf_counter()
+    for _ in range(samples):
+        function(t0, y0)
+    return (time.perf_counter() - start) / samples
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark per-step costs of ODE methods")
+    parser.add_argument("--epsilon", type=float, default=1e-4)
+    parser.add_argument("--output", default=DEFAULT_COSTS_PATH)
+    args = parser.parse_args()
+
+    header = f"{'equation':18s} {'method':18s} {'steps':>8s} {'rhs/step':>9s} {'overhead/step, s':>17s}"
+    print(header)
+    print("-" * len(header))
+    samples = {method.__name__: [] for method in ode_solve_methods}
+    for equation, function, y0, t0, t_end in PROBLEMS:
+        cost = rhs_cost(counting(function), t0, y0)
+        for method in ode_solve_methods:
+            stats = {}
+            _, _, exec_time = ODESolver.solve(function, method, args.epsilon, y0, t0, t_end,
+                                              max_iter=10**6, stats=stats)
+            steps = max(stats['accepted_steps'], 1)
+            rhs_per_step = stats['rhs_evaluations'] / steps
+            overhead = max(exec_time - stats['rhs_evaluations'] * cost, 0.0) / steps
+            samples[method.__name__].append((rhs_per_step, overhead))
+            print(f"{equation:18s} {method.__name__:18s} {steps:8d} {rhs_per_step:9.2f} {overhead:17.2e}")
+
+    methods = {}
+    for method in ode_solve_methods:
+        rhs_per_step, overhead = np.median(samples[method.__name__], axis=0)
+        methods[method.__name__] = {
+            'order': method.order,
+            'rhs_per_step': round(float(rhs_per_step), 3),
+            'overhead_per_step': float(f"{overhead:.3g}"),
+        }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({'epsilon': args.epsilon, 'methods': methods}, f, indent=4)
+        f.write("\n")
+    print(f"Saved {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,48 @@
+"""
+Compare adaptive step-size controllers by accepted/rejected steps and RHS evaluations.
+Run from the repository root:
+    python benchmarks/step_control.py [--epsilon EPS]
+"""
+import argparse
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core import ODESolver, EulerMethod, RungeKuttaMethod, step_size_controllers
+
+
+PROBLEMS = [
+    # (equation, f(t, y), y0, t0, t_end)
+    ("t + y", lambda t, y: t + y, 0.0, 0.0, 2.0),
+    ("y*cos(t)", lambda t, y: y * np.cos(t), 1.0, 0.0, 5.0),
+    ("-50*(y - cos(t))", lambda t, y: -50 * (y - np.cos(t)), 1.0, 0.0, 5.0),
+    ("sin(t*y)", lambda t, y: np.sin(t * y), 1.0, 0.0, 10.0),
+]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark adaptive step-size controllers")
+    parser.add_argument("--epsilon", type=float, default=1e-6)
+    args = parser.parse_args()
+
+    header = f"{'equation':18s} {'method':18s} {'controller':26s} {'accepted':>9s} {'rejected':>9s} {'rhs evals':>10s} {'time, s':>9s}"
+    print(header)
+    print("-" * len(header))
+    for equation, function, y0, t0, t_end in PROBLEMS:
+        for method in (EulerMethod, RungeKuttaMethod):
+            for controller in step_size_controllers:
+                stats = {}
+                _, _, exec_time = ODESolver.solve(
+                    function, method, args.epsilon, y0, t0, t_end,
+                    max_iter=10**6, controller=controller, stats=stats
+                )
+                print(f"{equation:18s} {method.__name__:18s} {controller.__name__:26s} "
+                      f"{stats['accepted_steps']:9d} {stats['rejected_steps']:9d} "
+                      f"{stats['rhs_evaluations']:10d} {exec_time:9.4f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,6 +1,19 @@
+from .tracing import Tracer
 from .methods import ODEMethodInterface, EulerMethod, RungeKuttaMethod, AdamsMethod
 ode_solve_methods: list[ODEMethodInterface] = [EulerMethod, RungeKuttaMethod, AdamsMethod]
 
+from .step_control import (
+    StepSizeControllerInterface, DoublingStepController, ElementaryStepController, PIStepController
+)
+step_size_controllers: list[StepSizeControllerInterface] = [
+    ElementaryStepController, PIStepController, DoublingStepController
+]
+
+from .structure import EquationStructure, EquationAnalyzer, StructuredSolver
 from .solver import ODESolver
 from .plotter import GraphPlotter
-from .comparison import MethodComparator
\ No newline at end of file
+from .comparison import MethodComparator
+from .reference import ReferenceSolver, ReferenceSolution
+from .auto import MethodCostModel, MethodSelection, MethodSelector
+from .sweep import ParameterizedEquation, ParameterSweep, parse_equation
+from .report import ReportRenderer, render_reports
\ No newline at end of file
@@ -0,0 +1,272 @@
+from typing import Callable, Optional
+import json
+import time
+import os
+import numpy as np
+from . import ode_solve_methods, ODEMethodInterface, StepSizeControllerInterface, ElementaryStepController
+from .solver import ODESolver
+
+
+DEFAULT_COSTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "method_costs.json")
+
+
+class MethodCostModel:
+    """
+    Cost model from stored benchmark results (see benchmarks/method_costs.py): for every method
+    the RHS evaluations and the overhead per accepted step, and its accuracy order p
+    (global error ~ h^p), which scales pilot runs to the requested accuracy.
+    """
+    def __init__(self, costs: dict[str, dict]):
+        """
+        Args:
+            costs: Method class name -> {'order', 'rhs_per_step', 'overhead_per_step'}.
+        """
+        self.costs = costs
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_COSTS_PATH) -> "MethodCostModel":
+        """Load stored benchmark results (an empty model if the file is missing or invalid)"""
+        try:
+            with open(path, encoding="utf-8") as f:
+                return cls(json.load(f).get("methods", {}))
+        except (OSError, ValueError):
+            return cls({})
+
+    def order(self, method: type[ODEMethodInterface]) -> float:
+        """Accuracy order of a method (its class attribute if it was not benchmarked)"""
+        return self.costs.get(method.__name__, {}).get("order", method.order)
+
+    def step_cost(self, method: type[ODEMethodInterface], measured_rhs_per_step: float) -> tuple[float, float]:
+        """
+        Returns (rhs_per_step, overhead_per_step) for a method, falling back to the pilot
+        measurement when there is no stored benchmark for it.
+        """
+        entry = self.costs.get(method.__name__)
+        if entry is None:
+            return measured_rhs_per_step, 0.0
+        return entry["rhs_per_step"], entry["overhead_per_step"]
+
+    def predict_time(self, method: type[ODEMethodInterface], steps: float,
+                     rhs_cost: float, measured_rhs_per_step: float) -> float:
+        """Predicted solve time: steps × (RHS evaluations per step × RHS cost + overhead per step)"""
+        rhs_per_step, overhead = self.step_cost(method, measured_rhs_per_step)
+        return steps * (rhs_per_step * rhs_cost + overhead)
+
+    def tolerance_scaling(self, method: type[ODEMethodInterface], tightening: float) -> tuple[float, float]:
+        """
+        Factors by which the steps and the global error of an adaptive solve change when the tolerance
+        is `tightening` times smaller: local error ~ h^(p+1) gives steps ~ tol^(-1/(p+1)) and error ~ steps^(-p).
+        """
+        p = self.order(method)
+        steps_factor = tightening ** (1 / (p + 1))
+        return steps_factor, steps_factor ** -p
+
+    def step_scaling(self, method: type[ODEMethodInterface], step_ratio: float) -> float:
+        """Factor by which the global error of a fixed-step solve changes when the step is step_ratio times larger"""
+        return step_ratio ** self.order(method)
+
+
+class MethodSelection:
+    """Outcome of automatic method selection"""
+    def __init__(self, method: type[ODEMethodInterface], reason: str, predictions: list[dict]):
+        self.method = method
+        self.reason = reason
+        self.predictions = predictions
+
+
+class MethodSelector:
+    """Choose the method predicted to reach epsilon fastest from RHS timing and pilot integrations"""
+    display_name = "Авто"
+    # adaptive pilots use a tolerance this many times looser than epsilon, but not looser than
+    # pilot_max_tolerance (the step counts and errors of looser solves do not scale to epsilon)
+    pilot_relaxation = 100.0
+    pilot_max_tolerance = 1e-3
+    # maximum number of step attempts of an adaptive pilot run
+    pilot_max_steps = 2000
+    # fixed-step pilots take at most this many steps (and twice as many for the error estimate)
+    pilot_fixed_steps = 100
+    # number of RHS calls timed to estimate the cost of one evaluation
+    rhs_samples = 20
+    # epsilon is a local tolerance for adaptive methods, so a global error up to this factor above it is accepted
+    error_slack = 10.0
+    cost_model: Optional[MethodCostModel] = None
+
+    @classmethod
+    def select(
+        cls,
+        function: Callable[[float, float], float],
+        epsilon: float,
+        y0: float,
+        t0: float,
+        t_end: float,
+        max_iter: int,
+        controller: type[StepSizeControllerInterface] = ElementaryStepController,
+        candidates: list[type[ODEMethodInterface]] = None
+    ) -> MethodSelection:
+        """
+        Predict the solve time and the error of every candidate and pick the fastest one that reaches epsilon
+        (or the most accurate one if none does). Pilots cover the whole interval with a looser tolerance
+        (or a coarser step); their global error is estimated by Richardson extrapolation and the cost
+        model's orders scale the steps and the error to epsilon.
+        Args:
+            function: Callable f(t, y) representing the ODE.
+            epsilon: Desired accuracy.
+            y0: Initial value y(t0).
+            t0: Initial time.
+            t_end: End time.
+            max_iter: Maximum number of steps of the full solve.
+            controller: Step-size controller cls used by adaptive methods.
+            candidates: Methods to choose from (defaults to all methods).
+        Returns:
+            MethodSelection with the chosen method, a human-readable reason and per-method predictions.
+        """
+        if cls.cost_model is None:
+            cls.cost_model = MethodCostModel.load()
+        candidates = candidates or ode_solve_methods
+        if not candidates:
+            raise ValueError("No candidate methods for automatic selection")
+
+        rhs_cost = cls._time_rhs(function, t0, y0)
+        predictions = []
+        for method in candidates:
+            try:
+                predictions.append(cls.predict(method, function, epsilon, y0, t0, t_end, max_iter,
+                                               controller, rhs_cost))
+            except (RuntimeError, ValueError, ArithmeticError) as e:
+                print(f"Pilot run error ({method.__name__}): {e}")
+        if not predictions:
+            # nothing could be measured, keep the most accurate candidate
+            best = max(candidates, key=lambda m: m.order)
+            return MethodSelection(best, f"Обрано «{best.display_name}»: пробні розрахунки не вдалися", [])
+
+        reaching = [p for p in predictions if p['reaches']]
+        if reaching:
+            best = min(reaching, key=lambda p: p['predicted_time'])
+        else:
+            best = min(predictions, key=lambda p: p['predicted_error'])
+        return MethodSelection(best['method'], cls._reason(best, predictions, rhs_cost, epsilon), predictions)
+
+    @classmethod
+    def _time_rhs(cls, function: Callable, t0: float, y0: float) -> float:
+        start = time.perf_counter()
+        for _ in range(cls.rhs_samples):
+            function(t0, y0)
+        return (time.perf_counter() - start) / cls.rhs_samples
+
+    @classmethod
+    def predict(
+        cls,
+        method: type[ODEMethodInterface],
+        function: Callable[[float, float], float],
+        epsilon: float,
+        y0: float,
+        t0: float,
+        t_end: float,
+        max_iter: int,
+        controller: type[StepSizeControllerInterface] = ElementaryStepController,
+        rhs_cost: Optional[float] = None
+    ) -> dict:
+        """
+        Predict the steps, the time and the global error of one method (see benchmarks/auto_selection.py,
+        which checks every prediction against full solves).
+        Args:
+            method: Numerical method cls.
+            function, epsilon, y0, t0, t_end, max_iter, controller: The problem, as for select.
+            rhs_cost: Time of one RHS evaluation in seconds (measured if not given).
+        Returns:
+            dict with 'method', 'order', 'steps', 'rhs_per_step', 'predicted_time',
+            'predicted_error' (largest error over the solution, inf if it cannot be estimated), 'reaches'
+            and 'pilot' (the 'epsilon' and 'max_iter' of the pilot solve and its 'estimated_error').
+        """
+        if cls.cost_model is None:
+            cls.cost_model = MethodCostModel.load()
+        if rhs_cost is None:
+            rhs_cost = cls._time_rhs(function, t0, y0)
+        span = t_end - t0
+        p = cls.cost_model.order(method)
+        stats = {}
+        if method().support_adaptive:
+            relaxation = max(1.0, min(cls.pilot_relaxation, cls.pilot_max_tolerance / epsilon))
+            pilot = {'epsilon': epsilon * relaxation, 'max_iter': cls.pilot_max_steps}
+            ts, ys, _ = ODESolver.solve(function, method, pilot['epsilon'], y0, t0, t_end,
+                                        max_iter=pilot['max_iter'], controller=controller, stats=stats)
+            steps_factor, error_factor = cls.cost_model.tolerance_scaling(method, relaxation)
+            # a pilot that runs out of attempts is extrapolated from the part of the interval it covered
+            covered = (ts[-1] - t0) / span
+            steps = stats['accepted_steps'] / max(covered, 1e-12) * steps_factor
+            error = np.inf
+            if np.isclose(ts[-1], t_end):
+                # accepted values come from two half steps, so the pilot is a fixed-step solve on the
+                # half-step mesh; redoing it with quarter steps gives its global error
+                refined = cls._resolve_on_mesh(function, method, ts, y0, substeps=4)
+                error = cls._richardson_error(ys, refined, p)
+            predicted_error = error * error_factor
+        else:
+            # fixed-step methods use h = (t_end - t0) * epsilon; the pilots use a coarser (or the same) step
+            n_full = min(int(span / (span * epsilon)) + 1, max_iter)
+            steps = n_full - 1
+            pilot_steps = max(1, min(cls.pilot_fixed_steps, steps))
+            # epsilon that makes the solver take exactly pilot_steps steps
+            pilot = {'epsilon': (1 - 1e-9) / pilot_steps, 'max_iter': pilot_steps + 1}
+            ts, ys, _ = ODESolver.solve(function, method, pilot['epsilon'], y0, t0, t_end,
+                                        max_iter=pilot['max_iter'], stats=stats)
+            error = np.inf
+            if np.isclose(ts[-1], t_end):
+                _, ys_half, _ = ODESolver.solve(function, method, (1 - 1e-9) / (2 * pilot_steps), y0, t0, t_end,
+                                                max_iter=2 * pilot_steps + 1)
+                if len(ys_half) == 2 * pilot_steps + 1:
+                    error = cls._richardson_error(ys, ys_half[::2], p)
+            predicted_error = error * cls.cost_model.step_scaling(method, pilot_steps / max(steps, 1))
+
+        pilot['estimated_error'] = error
+        measured_rhs_per_step = stats['rhs_evaluations'] / max(stats['accepted_steps'], 1)
+        predicted_time = cls.cost_model.predict_time(method, steps, rhs_cost, measured_rhs_per_step)
+        if steps > max_iter:
+            # the full solve stops before t_end
+            predicted_error = np.inf
+        return {
+            'method': method,
+            'order': p,
+            'steps': steps,
+            'rhs_per_step': cls.cost_model.step_cost(method, measured_rhs_per_step)[0],
+            'predicted_time': predicted_time,
+            'predicted_error': predicted_error,
+            'reaches': predicted_error <= epsilon * cls.error_slack,
+            'pilot': pilot,
+        }
+
+    @staticmethod
+    def _resolve_on_mesh(function: Callable, method: type[ODEMethodInterface], ts: np.ndarray, y0: float,
+                         substeps: int) -> np.ndarray:
+        """Solve again on the mesh ts with every interval split into substeps equal steps (values at ts)"""
+        method_inst = method()
+        ys = np.empty(len(ts))
+        ys[0] = y = y0
+        for i in range(1, len(ts)):
+            h = (ts[i] - ts[i - 1]) / substeps
+            for k in range(substeps):
+                y = method_inst.step(function, ts[i - 1] + k * h, y, h)
+            ys[i] = y
+        return ys
+
+    @staticmethod
+    def _richardson_error(coarse: np.ndarray, fine: np.ndarray, order: float) -> float:
+        """Largest global error of a solve of the given order from the same solve with half the step"""
+        with np.errstate(all="ignore"):
+            error = float(np.max(np.abs(fine - coarse))) / (1 - 2.0 ** -order)
+        return error if np.isfinite(error) else np.inf
+
+    @staticmethod
+    def _reason(best: dict, predictions: list[dict], rhs_cost: float, epsilon: float) -> str:
+        def describe(p: dict) -> str:
+            return (f"{p['predicted_time']:.2e} с, ~{p['steps']:.0f} кроків × {p['rhs_per_step']:.1f} обчислень f, "
+                    f"порядок {p['order']:.1f}, похибка ~{p['predicted_error']:.1e}")
+
+        accuracy = "досягає ε" if best['reaches'] else "жоден метод не досягає ε, обрано найточніший"
+        reason = (f"Обрано «{best['method'].display_name}» ({accuracy}, ε = {epsilon:g}): {describe(best)}; "
+                  f"f ≈ {rhs_cost * 1e6:.2f} мкс.")
+        others = [f"{p['method'].display_name}: {describe(p)}" + ("" if p['reaches'] else " (не досягає ε)")
+                  for p in predictions if p is not best]
+        if others:
+            reason += " Інші: " + "; ".join(others) + "."
+        return reason
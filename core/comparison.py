@@ -1,11 +1,13 @@
-from typing import Callable
-from . import ODEMethodInterface, ODESolver
+from typing import Callable, Optional
+import numpy as np
+from . import Tracer, ODEMethodInterface, ODESolver
 
 
 
 class MethodComparator:
     """Compare different ODE solving methods"""
     @staticmethod
+    @Tracer.traced("MethodComparator.compare_methods", cat="solver")
     def compare_methods(
         function: Callable,
         epsilon: float,
@@ -13,30 +15,69 @@ class MethodComparator:
         t0: float,
         t_end: float,
         methods: list[ODEMethodInterface],
-        max_iter: int = None
+        max_iter: int = None,
+        on_chunk: Optional[Callable[[str, np.ndarray, np.ndarray], None]] = None
     ) -> dict[str, dict]:
         """
         Compare multiple ODE solving methods
+        on_chunk: optional callback on_chunk(method_name, ts, ys) receiving partial trajectories
         Returns: dictionary with method names as keys and results as values
         """
         results = {}
         
         for method_class in methods:
             method_name = method_class.display_name
+            method_chunk = None
+            if on_chunk is not None:
+                method_chunk = lambda c_ts, c_ys, name=method_name: on_chunk(name, c_ts, c_ys)
             
-            ts, ys, exec_time = ODESolver.solve(
-                function=function,
-                method=method_class,
-                epsilon=epsilon,
-                y0=y0, t0=t0, t_end=t_end,
-                max_iter=max_iter
-            )
+            stats = {}
+            with Tracer.span("compare_method", cat="solver", method=method_class.__name__):
+                ts, ys, exec_time = ODESolver.solve(
+                    function=function,
+                    method=method_class,
+                    epsilon=epsilon,
+                    y0=y0, t0=t0, t_end=t_end,
+                    max_iter=max_iter,
+                    on_chunk=method_chunk,
+                    stats=stats
+                )
             num_points = len(ts)
             
             results[method_name] = {
                 'execution_time': exec_time,
                 'num_points': num_points,
+                'rejected_steps': stats['rejected_steps'],
+                'rhs_evaluations': stats['rhs_evaluations'],
+                'path': stats['path'],
                 'solution': (ts, ys)
             }
         
-        return results
\ No newline at end of file
+        return results
+
+    @staticmethod
+    def compute_errors(results: dict[str, dict], exact: Optional[Callable]) -> dict[str, dict]:
+        """
+        Compute errors of compare_methods results against an exact (or reference) solution
+        Args:
+            results: Output of compare_methods.
+            exact: Callable y(t) or None.
+        Returns: dictionary with method names as keys and {'ts', 'errors', 'max_error', 'mean_error'}
+                 as values (methods whose errors could not be computed are skipped)
+        """
+        error_results = {}
+        if not exact:
+            return error_results
+        for method_name, result in results.items():
+            ts, ys = result['solution']
+            exact_ys = ODESolver.evaluate_solution(exact, ts)
+            if exact_ys is None:
+                continue
+            errors = np.abs(exact_ys - ys)
+            error_results[method_name] = {
+                'ts': ts,
+                'errors': errors,
+                'max_error': np.max(errors) if len(errors) > 0 else 0,
+                'mean_error': np.mean(errors) if len(errors) > 0 else 0
+            }
+        return error_results
\ No newline at end of file
@@ -5,6 +5,9 @@ from abc import ABC, abstractmethod
 
 class ODEMethodInterface(ABC):
     """Base class for ODE methods"""
+    # order of accuracy, used by adaptive step-size control
+    order: int = 1
+
     @abstractmethod
     def step(self, f: Callable, t: float, y: float, h: float) -> float:
         """
@@ -31,6 +34,7 @@ class ODEMethodInterface(ABC):
 class EulerMethod(ODEMethodInterface):
     """Explicit Euler method"""
     display_name = "Метод Ейлера"
+    order = 1
     def step(self, f: Callable, t: float, y: float, h: float) -> float:
         return y + h * f(t, y)
     
@@ -41,6 +45,7 @@ class EulerMethod(ODEMethodInterface):
 class RungeKuttaMethod(ODEMethodInterface):
     """Explicit Runge-Kutta method"""
     display_name = "Метод Рунге-Кутта"
+    order = 4
     def step(self, f: Callable, t: float, y: float, h: float) -> float:
         k1 = f(t, y)
         k2 = f(t + h/2, y + h/2 * k1)
@@ -55,6 +60,7 @@ class RungeKuttaMethod(ODEMethodInterface):
 class AdamsMethod(ODEMethodInterface):
     """Explicit Adams-Bashforth 4th order method згідно з формулою (1.160)"""
     display_name = "Метод Адамса"
+    order = 4
     def __init__(self):
         self.reset()
     
@@ -1,8 +1,34 @@
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
 import numpy as np
+from .tracing import Tracer
 
 
+COLORS = ['blue', 'red', 'green', 'orange', 'purple', 'brown', 'pink', 'gray']
+LINESTYLES = ['-', '--', '-.', ':', '-', '--', '-.', ':']
+
+
+def draw_error_comparison(ax, results: dict) -> None:
+    """
+    Draw error curves of different methods on a matplotlib axes.
+    Args:
+        ax: Axes to draw on (cleared first).
+        results: dict[str, dict]
+                key = method_name,
+                value = {'ts': time points, 'errors': error values}
+    """
+    ax.clear()
+    for i, (method_name, result) in enumerate(results.items()):
+        ts, errors = result['ts'], result['errors']
+        color = COLORS[i % len(COLORS)]
+        linestyle = LINESTYLES[i % len(LINESTYLES)]
+        ax.plot(ts, errors, color=color, linestyle=linestyle, 
+                label=f"{method_name}", linewidth=2)
+    
+    ax.set_xlabel('t')
+    ax.set_ylabel('Похибка')
+    ax.set_title("Порівняння похибок методів розв'язування ДР")
+    ax.grid(True)
+    ax.legend()
+
 
 class GraphPlotter:
     """Plot numerical solutions of ODEs in a Tkinter frame."""
@@ -23,10 +49,124 @@ class GraphPlotter:
             column (int, optional): Grid column position for the canvas. Defaults to 0.
             sticky (str, optional): Tkinter sticky option for canvas placement. Defaults to "nsew".
         """
+        # matplotlib and the Tk backend are imported here so that `core` stays cheap to import
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        import matplotlib.pyplot as plt
+
         self.fig, self.ax = plt.subplots(figsize=figsize)
         self.canvas = FigureCanvasTkAgg(self.fig, master=master)
         self.canvas.get_tk_widget().grid(row=row, column=column, sticky=sticky)
 
+        self._live_line = None
+        self._live_background = None
+        self._live_draw_cid = None
+
+    def start_live(self, t0: float, t_end: float, y_label: str = "y", x_label: str = "t",
+                   analytical_ts: np.ndarray = None, analytical_ys: np.ndarray = None,
+                   max_points: int = 5000) -> None:
+        """
+        Prepare the plot for a solution that grows while it is being computed.
+        Points are added with append_live and drawn with blitting, so only the growing line is re-rendered.
+        Args:
+            t0: Initial time (left x limit).
+            t_end: End time (right x limit).
+            y_label: Label for y-axis.
+            x_label: Label for x-axis.
+            analytical_ts: Time points of the analytical solution drawn as a static background (optional).
+            analytical_ys: Analytical solution values at analytical_ts (optional).
+            max_points: Maximum number of points kept in the live line; older points are decimated beyond it.
+        """
+        self.finish_live()
+        self.ax.clear()
+        if analytical_ys is not None:
+            self.ax.plot(analytical_ts, analytical_ys, 'r--', label="Точний розв'язок")
+        self._live_line, = self.ax.plot([], [], 'b-', label="Чисельний розв'язок", animated=True)
+
+        self.ax.set_xlim(t0, t_end)
+        if analytical_ys is not None and np.isfinite(analytical_ys).all():
+            self._set_live_ylim(np.min(analytical_ys), np.max(analytical_ys))
+        self.ax.set_xlabel(x_label)
+        self.ax.set_ylabel(y_label)
+        self.ax.legend()
+        self.ax.grid(True)
+
+        self._live_max_points = max_points
+        self._live_stride = 1
+        self._live_count = 0
+        self._live_ts = np.empty(0)
+        self._live_ys = np.empty(0)
+        self._live_last = None
+        self._live_ylim = None if analytical_ys is None else self.ax.get_ylim()
+
+        # the background has to be re-captured after every full redraw (including window resizes)
+        self._live_draw_cid = self.canvas.mpl_connect('draw_event', self._on_live_draw)
+        with Tracer.span("canvas.draw", cat="gui"):
+            self.canvas.draw()
+
+    @Tracer.traced("GraphPlotter.append_live", cat="gui")
+    def append_live(self, ts: np.ndarray, ys: np.ndarray) -> None:
+        """
+        Append accepted solution points to the live line and blit it.
+        Args:
+            ts: New time points (increasing, after previously appended ones).
+            ys: Corresponding y values.
+        """
+        if self._live_line is None or len(ts) == 0:
+            return
+        # keep every stride-th point, counting from the start of the trajectory
+        first = (-self._live_count) % self._live_stride
+        self._live_ts = np.concatenate((self._live_ts, ts[first::self._live_stride]))
+        self._live_ys = np.concatenate((self._live_ys, ys[first::self._live_stride]))
+        self._live_count += len(ts)
+        self._live_last = (ts[-1], ys[-1])
+        while len(self._live_ts) > self._live_max_points:
+            self._live_ts, self._live_ys = self._live_ts[::2], self._live_ys[::2]
+            self._live_stride *= 2
+
+        self._live_line.set_data(np.append(self._live_ts, self._live_last[0]),
+                                 np.append(self._live_ys, self._live_last[1]))
+
+        finite = ys[np.isfinite(ys)]
+        if len(finite) and self._expand_live_ylim(np.min(finite), np.max(finite)):
+            # limits changed, so the cached background is stale
+            with Tracer.span("canvas.draw", cat="gui"):
+                self.canvas.draw()
+        elif self._live_background is not None:
+            self.canvas.restore_region(self._live_background)
+            self.ax.draw_artist(self._live_line)
+            self.canvas.blit(self.ax.bbox)
+        self.canvas.flush_events()
+
+    def finish_live(self) -> None:
+        """Stop live rendering (the next update_graph call redraws the complete solution)"""
+        if self._live_draw_cid is not None:
+            self.canvas.mpl_disconnect(self._live_draw_cid)
+        self._live_draw_cid = None
+        self._live_background = None
+        if self._live_line is not None:
+            self._live_line.set_animated(False)
+        self._live_line = None
+
+    def _on_live_draw(self, event) -> None:
+        self._live_background = self.canvas.copy_from_bbox(self.ax.bbox)
+        if self._live_line is not None:
+            self.ax.draw_artist(self._live_line)
+
+    def _expand_live_ylim(self, y_min: float, y_max: float) -> bool:
+        """Grow y limits (with headroom) if the new values do not fit. Returns True if limits changed"""
+        if self._live_ylim is not None and self._live_ylim[0] <= y_min and y_max <= self._live_ylim[1]:
+            return False
+        if self._live_ylim is not None:
+            y_min, y_max = min(y_min, self._live_ylim[0]), max(y_max, self._live_ylim[1])
+        self._set_live_ylim(y_min, y_max)
+        return True
+
+    def _set_live_ylim(self, y_min: float, y_max: float) -> None:
+        # headroom of a quarter span on each side keeps rescales (full redraws) rare
+        margin = 0.25 * (y_max - y_min) or 0.25 * max(abs(y_max), 1.0)
+        self._live_ylim = (y_min - margin, y_max + margin)
+        self.ax.set_ylim(*self._live_ylim)
+
     def update_graph(self, ts: np.ndarray, ys: np.ndarray, 
                      y_label: str = "y", x_label: str = "t", 
                      analytical_ys: float = None) -> None:
@@ -39,6 +179,7 @@ class GraphPlotter:
             x_label (str, optional): Label for x-axis and plot legend. Defaults to "t".
             analytical_ys: Array of analytical solution values for comparison
         """
+        self.finish_live()
         self.ax.clear()
         self.ax.plot(ts, ys, 'b-', label="Чисельний розв'язок")
         
@@ -49,7 +190,8 @@ class GraphPlotter:
         self.ax.set_ylabel(y_label)
         self.ax.legend()
         self.ax.grid(True)
-        self.canvas.draw()
+        with Tracer.span("canvas.draw", cat="gui"):
+            self.canvas.draw()
 
     def update_comparison_graph(self, results: dict) -> None:
         """
@@ -59,20 +201,7 @@ class GraphPlotter:
                     key = method_name, 
                     value = {'ts': time points, 'errors': error values}
         """
-        self.ax.clear()
-        colors = ['blue', 'red', 'green', 'orange', 'purple', 'brown', 'pink', 'gray']
-        linestyles = ['-', '--', '-.', ':', '-', '--', '-.', ':']
-        
-        for i, (method_name, result) in enumerate(results.items()):
-            ts, errors = result['ts'], result['errors']
-            color = colors[i % len(colors)]
-            linestyle = linestyles[i % len(linestyles)]
-            self.ax.plot(ts, errors, color=color, linestyle=linestyle, 
-                        label=f"{method_name}", linewidth=2)
-        
-        self.ax.set_xlabel('t')
-        self.ax.set_ylabel('Похибка')
-        self.ax.set_title("Порівняння похибок методів розв'язування ДР")
-        self.ax.grid(True)
-        self.ax.legend()
-        self.canvas.draw()
\ No newline at end of file
+        self.finish_live()
+        draw_error_comparison(self.ax, results)
+        with Tracer.span("canvas.draw", cat="gui"):
+            self.canvas.draw()
\ No newline at end of file
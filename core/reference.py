@@ -0,0 +1,107 @@
+from typing import Callable, Optional
+from collections import OrderedDict
+import threading
+import numpy as np
+from . import Tracer, ODEMethodInterface, RungeKuttaMethod, ODESolver
+
+
+
+class ReferenceSolution:
+    """Cubic Hermite interpolant of a high-accuracy numerical solution"""
+    def __init__(self, ts: np.ndarray, ys: np.ndarray, dys: np.ndarray, method_name: str, tolerance: float):
+        """
+        Args:
+            ts: Time points of the reference solve (increasing).
+            ys: Solution values at ts.
+            dys: Derivatives f(t, y) at ts.
+            method_name: Display name of the method used.
+            tolerance: Accuracy used for the reference solve.
+        """
+        self.ts, self.ys, self.dys = ts, ys, dys
+        self.method_name = method_name
+        self.tolerance = tolerance
+
+    def __call__(self, t):
+        """Evaluate the reference solution at t (scalar or array)"""
+        t = np.asarray(t, dtype=float)
+        ts, ys, dys = self.ts, self.ys, self.dys
+        if len(ts) < 2:
+            return np.full(t.shape, ys[0])
+        idx = np.clip(np.searchsorted(ts, t, side='right') - 1, 0, len(ts) - 2)
+        h = ts[idx + 1] - ts[idx]
+        s = (t - ts[idx]) / h
+        s2, s3 = s * s, s * s * s
+        return ((2*s3 - 3*s2 + 1) * ys[idx] + (s3 - 2*s2 + s) * h * dys[idx]
+                + (3*s2 - 2*s3) * ys[idx + 1] + (s3 - s2) * h * dys[idx + 1])
+
+    def describe(self) -> str:
+        return f"{self.method_name}, ε = {self.tolerance:g}"
+
+
+class ReferenceSolver:
+    """Computes and caches reference solutions for equations without an exact solution"""
+    method: type[ODEMethodInterface] = RungeKuttaMethod
+    tolerance: float = 1e-10
+    max_iter: int = 1_000_000
+    cache_size: int = 32
+    _cache: OrderedDict[tuple, ReferenceSolution] = OrderedDict()
+    # references are computed from GUI worker threads too
+    _lock = threading.Lock()
+
+    @classmethod
+    @Tracer.traced("ReferenceSolver.get_reference", cat="solver")
+    def get_reference(
+        cls,
+        function: Callable[[float, float], float],
+        equation_str: str,
+        y0: float,
+        t0: float,
+        t_end: float
+    ) -> Optional[ReferenceSolution]:
+        """
+        Return a cached reference solution or compute a new one with a tight tolerance.
+        Args:
+            function: Callable f(t, y) representing the ODE.
+            equation_str: Right side of the ODE (part of the cache key).
+            y0: Initial value y(t0).
+            t0: Initial time.
+            t_end: End time.
+        Returns:
+            ReferenceSolution interpolant, or None if the reference solve fails.
+        """
+        key = (equation_str, float(y0), float(t0), float(t_end))
+        with cls._lock:
+            if key in cls._cache:
+                cls._cache.move_to_end(key)
+                return cls._cache[key]
+
+        try:
+            ts, ys, _ = ODESolver.solve(
+                function=function,
+                method=cls.method,
+                epsilon=cls.tolerance,
+                y0=y0, t0=t0, t_end=t_end,
+                max_iter=cls.max_iter
+            )
+        except (RuntimeError, ValueError, OverflowError, ZeroDivisionError) as e:
+            print(f"Reference solution error: {e}")
+            return None
+        if not np.isclose(ts[-1], t_end) or not np.isfinite(ys).all():
+            return None
+
+        try:
+            dys = np.broadcast_to(np.asarray(function(ts, ys), dtype=float), ts.shape)
+        except Exception:
+            dys = np.array([function(t, y) for t, y in zip(ts, ys)], dtype=float)
+        reference = ReferenceSolution(ts, ys, dys, cls.method.display_name, cls.tolerance)
+
+        with cls._lock:
+            cls._cache[key] = reference
+            if len(cls._cache) > cls.cache_size:
+                cls._cache.popitem(last=False)
+        return reference
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        with cls._lock:
+            cls._cache.clear()
@@ -0,0 +1,176 @@
+from typing import Callable, Optional
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import csv
+import os
+from .plotter import COLORS, draw_error_comparison
+from .comparison import MethodComparator
+from .solver import ODESolver
+from .reference import ReferenceSolver
+from .sweep import parse_equation
+
+
+
+class ReportRenderer:
+    """Render method comparison reports to files with the Agg backend (no Tk required)"""
+    def __init__(self, figsize: tuple[float, float] = (8, 8), dpi: int = 100, formats: tuple[str, ...] = ("png",)):
+        """
+        Args:
+            figsize: Size of the figure in inches (width, height).
+            dpi: Resolution of raster images.
+            formats: Image formats to write, e.g. ("png", "svg").
+        """
+        self.figsize = figsize
+        self.dpi = dpi
+        self.formats = formats
+        self.fig = None
+
+    def _figure(self):
+        """Returns the figure and its two axes, created once and reused for every report"""
+        if self.fig is None:
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+            self.fig = Figure(figsize=self.figsize, dpi=self.dpi)
+            FigureCanvasAgg(self.fig)
+            self.solution_ax, self.error_ax = self.fig.subplots(2, 1)
+        return self.fig, self.solution_ax, self.error_ax
+
+    def render(self, name: str, results: dict[str, dict], output_dir: str,
+               exact: Optional[Callable] = None, title: str = None) -> list[str]:
+        """
+        Write the solution/error figure and the error/timing table of one comparison.
+        Args:
+            name: Base file name of the report.
+            results: Output of MethodComparator.compare_methods.
+            output_dir: Directory for the report files (created if missing).
+            exact: Exact or reference solution y(t) used for errors (optional).
+            title: Figure title (defaults to name).
+        Returns:
+            List of written file paths.
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        error_results = MethodComparator.compute_errors(results, exact)
+        fig, solution_ax, error_ax = self._figure()
+
+        solution_ax.clear()
+        for i, (method_name, result) in enumerate(results.items()):
+            ts, ys = result['solution']
+            solution_ax.plot(ts, ys, color=COLORS[i % len(COLORS)], label=method_name)
+        solution_ax.set_xlabel('t')
+        solution_ax.set_ylabel('y')
+        solution_ax.set_title(title or name)
+        solution_ax.grid(True)
+        solution_ax.legend()
+
+        error_ax.set_visible(bool(error_results))
+        if error_results:
+            draw_error_comparison(error_ax, error_results)
+        fig.tight_layout()
+
+        paths = []
+        for fmt in self.formats:
+            path = os.path.join(output_dir, f"{name}.{fmt}")
+            fig.savefig(path, format=fmt)
+            paths.append(path)
+
+        table_path = os.path.join(output_dir, f"{name}.csv")
+        with open(table_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["method", "execution_time", "num_points", "rejected_steps",
+                             "rhs_evaluations", "max_error", "mean_error"])
+            for method_name, result in results.items():
+                errors = error_results.get(method_name, {})
+                writer.writerow([
+                    method_name,
+                    f"{result['execution_time']:.6f}",
+                    result['num_points'],
+                    result.get('rejected_steps', ""),
+                    result.get('rhs_evaluations', ""),
+                    f"{errors['max_error']:.6g}" if errors else "",
+                    f"{errors['mean_error']:.6g}" if errors else "",
+                ])
+        paths.append(table_path)
+        return paths
+
+
+# renderer of the current worker process, reused across reports
+_worker_renderer: Optional[ReportRenderer] = None
+
+
+def _init_worker(figsize: tuple[float, float], dpi: int, formats: tuple[str, ...]) -> None:
+    global _worker_renderer
+    _worker_renderer = ReportRenderer(figsize, dpi, formats)
+
+
+def _render_report(report: dict, output_dir: str) -> list[str]:
+    """
+    Render one report spec in a worker. If the spec has no 'results', the comparison is computed here.
+    The exact solution comes from solve_analytical, falling back to a reference solution.
+    """
+    name = report['name']
+    equation_str = report.get('equation')
+    results = report.get('results')
+    y0, t0 = report.get('y0', 0.0), report.get('t0', 0.0)
+
+    function = None
+    if equation_str is not None:
+        function = parse_equation(equation_str, f"report '{name}'")
+    if results is None:
+        results = MethodComparator.compare_methods(
+            function, report['epsilon'], y0, t0, report['t_end'], report['methods'], report.get('max_iter')
+        )
+
+    exact = None
+    if equation_str is not None:
+        analytical = ODESolver.solve_analytical(equation_str, (t0, y0))
+        if analytical:
+            exact = analytical[0]
+        else:
+            t_end = max(result['solution'][0][-1] for result in results.values())
+            exact = ReferenceSolver.get_reference(function, equation_str, y0, t0, t_end)
+
+    title = f"y' = {equation_str}" if equation_str is not None else name
+    return _worker_renderer.render(name, results, output_dir, exact=exact, title=title)
+
+
+def render_reports(
+    reports: list[dict],
+    output_dir: str,
+    workers: Optional[int] = None,
+    formats: tuple[str, ...] = ("png",),
+    figsize: tuple[float, float] = (8, 8),
+    dpi: int = 100
+) -> dict[str, list[str]]:
+    """
+    Render many comparison reports in parallel.
+    Args:
+        reports: Report specs, each a dict with 'name' and either
+                 'results' (MethodComparator output, plus optional 'equation', 'y0', 't0' for errors) or
+                 'equation', 'epsilon', 'y0', 't0', 't_end', 'methods' (and optional 'max_iter')
+                 to run the comparison inside the worker.
+        output_dir: Directory for the report files.
+        workers: Number of worker processes (defaults to the CPU count; 1 renders in this process).
+        formats: Image formats to write, e.g. ("png", "svg").
+        figsize: Size of the figures in inches.
+        dpi: Resolution of raster images.
+    Returns:
+        Report name -> list of written file paths.
+    """
+    names = [report['name'] for report in reports]
+    if len(set(names)) != len(names):
+        raise ValueError("Report names must be unique")
+
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    if workers <= 1 or len(reports) <= 1:
+        _init_worker(figsize, dpi, formats)
+        paths = [_render_report(report, output_dir) for report in reports]
+    else:
+        workers = min(workers, len(reports))
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context(),
+            initializer=_init_worker, initargs=(figsize, dpi, formats)
+        ) as pool:
+            chunksize = max(1, len(reports) // (4 * workers))
+            paths = list(pool.map(_render_report, reports, [output_dir] * len(reports), chunksize=chunksize))
+    return dict(zip(names, paths))
@@ -1,8 +1,11 @@
 from typing import Callable, Optional
-import sympy as sp
+from functools import lru_cache
 import numpy as np
 import time
-from . import ODEMethodInterface
+from . import Tracer, ODEMethodInterface, StepSizeControllerInterface, ElementaryStepController
+from . import EquationStructure, EquationAnalyzer, StructuredSolver
+
+ChunkCallback = Callable[[np.ndarray, np.ndarray], None]
 
 
 class ODESolver:
@@ -11,7 +14,7 @@ class ODESolver:
     @staticmethod
     def _validate_inputs(y0: float, t0: float, t_end: float, epsilon: float):
         """Validate solver inputs"""
-        if not np.isfinite([y0, t0, t_end, epsilon]).all():
+        if not np.isfinite(np.append(np.ravel(y0), [t0, t_end, epsilon])).all():
             raise ValueError("All parameters must be finite numbers")
         if epsilon <= 0:
             raise ValueError("Epsilon must be positive")
@@ -19,25 +22,43 @@ class ODESolver:
             raise ValueError("t_end must be greater than t0")
     
     @staticmethod
+    @Tracer.traced("ODESolver.solve", cat="solver")
     def solve(
         function: Callable[[float, float], float],
-        method: type[ODEMethodInterface],
+        method: Optional[type[ODEMethodInterface]],
         epsilon: float,
         y0: float,
         t0: float,
         t_end: float,
-        max_iter: int = None
+        max_iter: int = None,
+        on_chunk: Optional[ChunkCallback] = None,
+        chunk_size: int = 256,
+        controller: type[StepSizeControllerInterface] = ElementaryStepController,
+        stats: Optional[dict] = None,
+        equation: Optional[str] = None
     ) -> tuple[np.ndarray, np.ndarray, float]:
         """
         Solve an ODE y' = f(t, y) numerically using the selected method with a fixed step size.
         Args:
             function: Callable f(t, y) representing the ODE.
             epsilon: Desired accuracy (not used in fixed-step method, kept for compatibility).
-            method: Numerical method cls for solving differential equations.
-            y0: Initial value y(t0).
+            method: Numerical method cls for solving differential equations, or None to let
+                    MethodSelector pick the method predicted to reach epsilon fastest.
+            y0: Initial value y(t0), or (for fixed-step methods) an array of initial values to solve
+                a batch of independent problems with shared steps (see solve_batch for adaptive methods).
             t0: Initial time.
             t_end: End time.
             max_iter: Maximum number of steps (optional, defaults to 10000).
+            on_chunk: Optional callback on_chunk(ts, ys) receiving accepted points in chunks
+                      while the solve is running (the first chunk starts with (t0, y0)).
+            chunk_size: Number of accepted points per chunk passed to on_chunk.
+            controller: Step-size controller cls used by adaptive methods.
+            stats: Optional dict filled with 'accepted_steps', 'rejected_steps', 'rhs_evaluations'
+                   and 'path' (the solver path that was used); when the method was selected
+                   automatically also 'selected_method' and 'selection_reason'.
+            equation: String form of f(t, y) (optional). When given, quadrature-type (y' = g(t)) and
+                      linear (y' = a(t)·y + b(t)) equations are solved by StructuredSolver on a whole grid
+                      instead of the selected method.
         Returns:
             Tuple of arrays (ts, ys, exec_time):
                 ts: Array of time points.
@@ -48,20 +69,56 @@ class ODESolver:
         
         # Default step size
         max_iter = 10000 if max_iter is None else max_iter
-        solver_method = method()
+        counters = {'accepted_steps': 0, 'rejected_steps': 0, 'rhs_evaluations': 0,
+                    'path': EquationStructure.GENERAL}
+        if stats is not None:
+            function = ODESolver._count_calls(function, counters)
+        structure = None
+        if equation is not None:
+            with Tracer.span("EquationAnalyzer.analyze", cat="solver"):
+                structure = EquationAnalyzer.analyze(equation)
         
         start_time = time.time()
-        if solver_method.support_adaptive:
-            ts, ys = ODESolver._solve_adaptive(
-                function, solver_method, epsilon, y0, t0, t_end, max_iter
-            )
-        else:
-            h = (t_end - t0) * epsilon
-            ts, ys = ODESolver._solve_fixed_step(
-                function, solver_method, h, y0, t0, t_end, max_iter
-            )
+        ts = None
+        if structure is not None and structure.kind != EquationStructure.GENERAL:
+            try:
+                ts, ys = StructuredSolver.solve(structure, epsilon, y0, t0, t_end, max_iter, counters)
+                counters['accepted_steps'] = len(ts) - 1
+                counters['path'] = structure.kind
+                if on_chunk is not None:
+                    on_chunk(ts, ys)
+            except FloatingPointError:
+                # coefficients are not finite on the interval (e.g. 1/t at t = 0);
+                # the step-by-step path reports the problem the usual way
+                ts = None
+        if ts is None:
+            if method is None:
+                # selection (pilot runs and their RHS evaluations included) counts towards the cost
+                from .auto import MethodSelector
+                selection = MethodSelector.select(function, epsilon, y0, t0, t_end, max_iter, controller)
+                method = selection.method
+                counters['selected_method'] = method.display_name
+                counters['selection_reason'] = selection.reason
+
+            solver_method = method()
+            if solver_method.support_adaptive:
+                if np.ndim(y0):
+                    raise ValueError("Adaptive methods solve batches with ODESolver.solve_batch")
+                ts, ys = ODESolver._solve_adaptive(
+                    function, solver_method, epsilon, y0, t0, t_end, max_iter, on_chunk, chunk_size,
+                    controller(), counters
+                )
+            else:
+                h = (t_end - t0) * epsilon
+                ts, ys = ODESolver._solve_fixed_step(
+                    function, solver_method, h, y0, t0, t_end, max_iter, on_chunk, chunk_size
+                )
+                counters['accepted_steps'] = len(ts) - 1
         exec_time = time.time() - start_time
 
+        if stats is not None:
+            stats.update(counters)
+
         return ts, ys, exec_time
 
     @staticmethod
@@ -72,40 +129,163 @@ class ODESolver:
         y0: float,
         t0: float,
         t_end: float,
-        max_iter: int
+        max_iter: int,
+        on_chunk: Optional[ChunkCallback] = None,
+        chunk_size: int = 256,
+        controller: Optional[StepSizeControllerInterface] = None,
+        counters: Optional[dict] = None
     ) -> tuple[np.ndarray, np.ndarray]:
+        controller = ElementaryStepController() if controller is None else controller
+        counters = {'accepted_steps': 0, 'rejected_steps': 0} if counters is None else counters
+        order = method_inst.order
         ts, ys = [t0], [y0]
         t, y = t0, y0
-        h  = (t_end - t0) * 0.01
+        emitted = 0
+        controller.reset()
+        h = controller.initial_step(function, t0, y0, t_end - t0, epsilon, order)
         h_min = (t_end - t0) * 1e-12
 
         cnt = 0
         while t < t_end and cnt <= max_iter:
-            if t + h > t_end:
+            last_step = t + h >= t_end
+            if last_step:
                 h = t_end - t
 
             y1 = method_inst.step(function, t, y, h)
             y_half = method_inst.step(function, t, y, h / 2)
             y2 = method_inst.step(function, t + h / 2, y_half, h / 2)
-            error = abs(y2 - y1)
+            # Richardson estimate of the local error of y2 (step doubling)
+            error_ratio = abs(y2 - y1) / (2 ** order - 1) / epsilon
+            if not np.isfinite(error_ratio):
+                error_ratio = np.inf
 
-            if error < epsilon:
-                t += h
+            if error_ratio <= 1:
+                t = t_end if last_step else t + h
                 y = y2
+                counters['accepted_steps'] += 1
                 ts.append(t)
                 ys.append(y)
 
-                if error < epsilon / 4:
-                    h *= 2
+                if on_chunk is not None and len(ts) - emitted >= chunk_size:
+                    on_chunk(np.array(ts[emitted:]), np.array(ys[emitted:]))
+                    emitted = len(ts)
+
+                h = controller.accept(h, error_ratio, order)
             else:
-                h /= 2
+                counters['rejected_steps'] += 1
+                h = controller.reject(h, error_ratio, order)
                 if h < h_min:
                     raise RuntimeError("Step size became too small")
                 
             cnt += 1
 
+        if on_chunk is not None and len(ts) > emitted:
+            on_chunk(np.array(ts[emitted:]), np.array(ys[emitted:]))
         return np.array(ts), np.array(ys)
 
+    @staticmethod
+    @Tracer.traced("ODESolver.solve_batch", cat="solver")
+    def solve_batch(
+        rhs_for: Callable[[np.ndarray], Callable[[float, float], float]],
+        method: type[ODEMethodInterface],
+        epsilon: float,
+        y0: np.ndarray,
+        t0: float,
+        t_end: float,
+        max_iter: int = None,
+        controller: type[StepSizeControllerInterface] = ElementaryStepController
+    ) -> np.ndarray:
+        """
+        Solve a batch of independent problems (e.g. the points of a parameter grid) up to t_end.
+        Adaptive methods keep a time and a step size per problem, so a problem that needs tiny steps
+        (or diverges) does not hold back the others; fixed-step methods share the step.
+        Args:
+            rhs_for: Returns f(t, y) vectorized over the problems with the given indices.
+            method: Numerical method cls for solving differential equations.
+            epsilon: Desired accuracy.
+            y0: Initial values y(t0), one per problem.
+            t0: Initial time.
+            t_end: End time.
+            max_iter: Maximum number of steps (step attempts per problem for adaptive methods, defaults to 10000).
+            controller: Step-size controller cls used by adaptive methods.
+        Returns:
+            y(t_end) for each problem (NaN for problems that diverge, cannot meet epsilon or do not reach t_end).
+        """
+        y0 = np.asarray(y0, dtype=float)
+        ODESolver._validate_inputs(y0, t0, t_end, epsilon)
+        max_iter = 10000 if max_iter is None else max_iter
+        method_inst = method()
+        with np.errstate(all="ignore"):
+            if method_inst.support_adaptive:
+                return ODESolver._solve_adaptive_batch(rhs_for, method_inst, epsilon, y0, t0, t_end,
+                                                       max_iter, controller())
+            ts, ys = ODESolver._solve_fixed_step(rhs_for(np.arange(len(y0))), method_inst,
+                                                 (t_end - t0) * epsilon, y0, t0, t_end, max_iter)
+        return ys[-1] if np.isclose(ts[-1], t_end) else np.full(len(y0), np.nan)
+
+    @staticmethod
+    def _solve_adaptive_batch(
+        rhs_for: Callable[[np.ndarray], Callable[[float, float], float]],
+        method_inst: ODEMethodInterface,
+        epsilon: float,
+        y0: np.ndarray,
+        t0: float,
+        t_end: float,
+        max_iter: int,
+        controller: StepSizeControllerInterface
+    ) -> np.ndarray:
+        """
+        Step doubling as in _solve_adaptive, vectorized over the batch. Finished and failed problems leave
+        the batch; problems that have not reached t_end after max_iter attempts, whose step becomes too small
+        or whose value is not finite give NaN.
+        """
+        n_points = len(y0)
+        order = method_inst.order
+        ts, ys = np.full(n_points, float(t0)), y0.copy()
+        controller.reset(n_points)
+        h = np.full(n_points, float(controller.initial_step(
+            rhs_for(np.arange(n_points)), t0, ys, t_end - t0, epsilon, order)))
+        h_min = (t_end - t0) * 1e-12
+
+        active = np.arange(n_points)
+        for _ in range(max_iter):
+            if len(active) == 0:
+                break
+            function = rhs_for(active)
+            t, y = ts[active], ys[active]
+            last_step = h[active] >= t_end - t
+            step = np.where(last_step, t_end - t, h[active])
+
+            y1 = method_inst.step(function, t, y, step)
+            y_half = method_inst.step(function, t, y, step / 2)
+            y2 = method_inst.step(function, t + step / 2, y_half, step / 2)
+            error_ratio = np.abs(y2 - y1) / (2 ** order - 1) / epsilon
+            error_ratio[~np.isfinite(error_ratio)] = np.inf
+
+            accepted = error_ratio <= 1
+            rejected = ~accepted
+            ts[active] = np.where(accepted, np.where(last_step, t_end, t + step), t)
+            ys[active] = np.where(accepted, y2, y)
+            h_new = np.empty(len(active))
+            h_new[accepted] = controller.accept(step[accepted], error_ratio[accepted], order, active[accepted])
+            h_new[rejected] = controller.reject(step[rejected], error_ratio[rejected], order, active[rejected])
+            h[active] = h_new
+
+            failed = ~np.isfinite(ys[active]) | (h[active] < h_min)
+            ys[active[failed]] = np.nan
+            active = active[~failed & (ts[active] < t_end)]
+
+        ys[active] = np.nan
+        return ys
+
+    @staticmethod
+    def _count_calls(function: Callable[[float, float], float], counters: dict) -> Callable[[float, float], float]:
+        """Wraps f(t, y) so that every call increments counters['rhs_evaluations']"""
+        def counted(t, y):
+            counters['rhs_evaluations'] += 1
+            return function(t, y)
+        return counted
+
     @staticmethod
     def _solve_fixed_step(
         function: Callable[[float, float], float],
@@ -114,25 +294,63 @@ class ODESolver:
         y0: float,
         t0: float,
         t_end: float,
-        max_iter: int
+        max_iter: int,
+        on_chunk: Optional[ChunkCallback] = None,
+        chunk_size: int = 256
     ) -> tuple[np.ndarray, np.ndarray]:
         n_steps = min(int((t_end - t0) / h) + 1, max_iter)
         ts = np.linspace(t0, t_end, n_steps)
-        ys = np.zeros_like(ts)
+        ys = np.zeros((n_steps,) + np.shape(y0))
         ys[0] = y0
 
+        n_valid, emitted = n_steps, 0
         for i in range(1, n_steps):
             actual_h = ts[i] - ts[i-1]
             y_new = method_inst.step(function, ts[i-1], ys[i-1], actual_h)
             
-            if not np.isfinite(y_new) or abs(y_new) > 1e10:
-                return ts[:i], ys[:i]
+            diverged = ~np.isfinite(y_new) | (np.abs(y_new) > 1e10)
+            if np.ndim(y_new) and not diverged.all():
+                # a batch keeps stepping; only its diverged problems are frozen at NaN
+                y_new = np.where(diverged, np.nan, y_new)
+            elif np.any(diverged):
+                n_valid = i
+                break
             
             ys[i] = y_new
 
-        return ts, ys
+            if on_chunk is not None and i + 1 - emitted >= chunk_size:
+                on_chunk(ts[emitted:i+1].copy(), ys[emitted:i+1].copy())
+                emitted = i + 1
+
+        if on_chunk is not None and n_valid > emitted:
+            on_chunk(ts[emitted:n_valid].copy(), ys[emitted:n_valid].copy())
+        return ts[:n_valid], ys[:n_valid]
     
     @staticmethod
+    def evaluate_solution(solution: Callable, ts: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Evaluate a solution function y(t) on an array of time points.
+        The function is called once on the whole array when it supports it,
+        otherwise point by point.
+        Args:
+            solution: Callable y(t), e.g. an analytical or reference solution.
+            ts: Array of time points.
+        Returns:
+            Array of values with the shape of ts, or None if evaluation fails.
+        """
+        try:
+            values = np.asarray(solution(ts), dtype=float)
+            # constant solutions evaluate to a scalar
+            return np.broadcast_to(values, ts.shape)
+        except Exception:
+            pass
+        try:
+            return np.array([solution(t) for t in ts], dtype=float)
+        except Exception:
+            return None
+
+    @staticmethod
+    @Tracer.traced("ODESolver.solve_analytical", cat="solver")
     def solve_analytical(equation_str: str, initial_condition: tuple[float, float]) -> Optional[tuple[Callable, str]]:
         """
         Solve ODE analytically using SymPy
@@ -142,6 +360,16 @@ class ODESolver:
         Returns:
             Callable function y(t) and exact solution (equation) or None if solution not found
         """
+        t0, y0 = initial_condition
+        return ODESolver._solve_analytical_cached(equation_str, float(t0), float(y0))
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _solve_analytical_cached(equation_str: str, t0: float, y0: float) -> Optional[tuple[Callable, str]]:
+        # dsolve can take seconds, so solutions are memoized per (equation, t0, y0)
+        # sympy is slow to import, so load it only when symbolic solving is requested
+        import sympy as sp
+
         try:
             t = sp.symbols('t')
             y_func = sp.Function('y')
@@ -151,7 +379,6 @@ class ODESolver:
             ode_eq = sp.Eq(y_func(t).diff(t), rhs)
             solution = sp.dsolve(ode_eq, y_func(t))
             
-            t0, y0 = initial_condition
             if hasattr(solution, 'rhs'):
                 constants = list(solution.rhs.free_symbols - {t})
                 if constants:
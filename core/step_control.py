@@ -0,0 +1,193 @@
+from typing import Callable, Optional
+from abc import ABC, abstractmethod
+import numpy as np
+
+
+
+def estimate_initial_step(
+    f: Callable[[float, float], float],
+    t0: float,
+    y0: float,
+    order: int,
+    epsilon: float,
+    t_span: float
+) -> float:
+    """
+    Estimate a starting step size from the local behaviour of f (Hairer, Nørsett & Wanner, II.4).
+    Args:
+        f: Function f(t, y) returning derivative dy/dt.
+        t0: Initial time.
+        y0: Initial value.
+        order: Order of the integration method.
+        epsilon: Desired accuracy.
+        t_span: Length of the integration interval (upper bound for the step).
+    Returns:
+        Initial step size.
+    """
+    f0 = f(t0, y0)
+    d0, d1 = np.max(np.abs(y0)) / epsilon, np.max(np.abs(f0)) / epsilon
+    h0 = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+    h0 = min(h0, t_span)
+
+    f1 = f(t0 + h0, y0 + h0 * f0)
+    d2 = np.max(np.abs(f1 - f0)) / epsilon / h0
+    if max(d1, d2) <= 1e-15:
+        h1 = max(1e-6, h0 * 1e-3)
+    else:
+        h1 = (0.01 / max(d1, d2)) ** (1 / (order + 1))
+
+    h = min(100 * h0, h1, t_span)
+    return h if np.isfinite(h) and h > 0 else t_span * 0.01
+
+
+class StepSizeControllerInterface(ABC):
+    """
+    Base class for adaptive step-size controllers.
+    accept and reject take scalars for a single problem, or arrays for a batch of independent problems
+    (see ODESolver.solve_batch); the points argument then says which problems of the batch the steps belong to.
+    """
+    display_name = "Step size controller"
+
+    def reset(self, size: Optional[int] = None):
+        """Reset controller state (for controllers that remember previous steps) for one problem or a batch of size"""
+        pass
+
+    def initial_step(self, f: Callable, t0: float, y0: float, t_span: float, epsilon: float, order: int) -> float:
+        """Step size to start the integration with"""
+        return estimate_initial_step(f, t0, y0, order, epsilon, t_span)
+
+    @abstractmethod
+    def accept(self, h: float, error_ratio: float, order: int, points: Optional[np.ndarray] = None) -> float:
+        """
+        Propose the next step after an accepted step.
+        Args:
+            h: Size of the accepted step.
+            error_ratio: Estimated local error divided by epsilon (<= 1).
+            order: Order of the integration method.
+            points: Indices of the batch problems h belongs to (None for a single problem).
+        Returns:
+            Next step size.
+        """
+        pass
+
+    @abstractmethod
+    def reject(self, h: float, error_ratio: float, order: int, points: Optional[np.ndarray] = None) -> float:
+        """
+        Propose a retry step after a rejected step.
+        Args:
+            h: Size of the rejected step.
+            error_ratio: Estimated local error divided by epsilon (> 1, may be inf).
+            order: Order of the integration method.
+            points: Indices of the batch problems h belongs to (None for a single problem).
+        Returns:
+            Smaller step size.
+        """
+        pass
+
+
+class DoublingStepController(StepSizeControllerInterface):
+    """Halve on rejection, double when the error is well below epsilon (the original rule)"""
+    display_name = "Подвоєння/поділ кроку"
+
+    def initial_step(self, f: Callable, t0: float, y0: float, t_span: float, epsilon: float, order: int) -> float:
+        return t_span * 0.01
+
+    def accept(self, h: float, error_ratio: float, order: int, points: Optional[np.ndarray] = None) -> float:
+        if np.ndim(h):
+            return np.where(error_ratio < 0.25, h * 2, h)
+        return h * 2 if error_ratio < 0.25 else h
+
+    def reject(self, h: float, error_ratio: float, order: int, points: Optional[np.ndarray] = None) -> float:
+        return h / 2
+
+
+class ElementaryStepController(StepSizeControllerInterface):
+    """Order-aware controller h_new = h * safety * (1 / ratio)^(1 / (p + 1)) (the default controller)"""
+    display_name = "Елементарний регулятор"
+    safety = 0.9
+    fac_min = 0.2
+    fac_max = 5.0
+
+    def accept(self, h: float, error_ratio: float, order: int, points: Optional[np.ndarray] = None) -> float:
+        return h * self._factor(error_ratio, order, self.fac_max)
+
+    def reject(self, h: float, error_ratio: float, order: int, points: Optional[np.ndarray] = None) -> float:
+        # never grow the step right after a rejection
+        return h * self._factor(error_ratio, order, 1.0)
+
+    def _factor(self, error_ratio: float, order: int, fac_max: float) -> float:
+        if np.ndim(error_ratio):
+            # inf -> 0 and 0 -> inf are clipped to fac_min and fac_max like the scalar cases below
+            with np.errstate(divide="ignore"):
+                factor = self.safety * error_ratio ** (-1 / (order + 1))
+            return np.clip(np.nan_to_num(factor, nan=self.fac_min), self.fac_min, fac_max)
+        if not np.isfinite(error_ratio):
+            return self.fac_min
+        if error_ratio == 0:
+            return fac_max
+        factor = self.safety * error_ratio ** (-1 / (order + 1))
+        return min(fac_max, max(self.fac_min, factor))
+
+
+class PIStepController(ElementaryStepController):
+    """
+    PI (Gustafsson) controller: h_new = h * safety * ratio^(-alpha) * prev_ratio^beta,
+    with alpha = 0.7 / (p + 1) and beta = 0.4 / (p + 1). The proportional term damps
+    the step-size oscillations of the elementary controller, but the steps it settles on are smaller:
+    on the benchmarks/step_control.py problems it needs more RHS evaluations, so it is an option
+    rather than the default.
+    """
+    display_name = "PI-регулятор"
+    alpha_coef = 0.7
+    beta_coef = 0.4
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self, size: Optional[int] = None):
+        if size is None:
+            self.prev_ratio = None
+            self.rejected_last = False
+        else:
+            # one state per problem of the batch; NaN marks problems without an accepted step yet
+            self.prev_ratio = np.full(size, np.nan)
+            self.rejected_last = np.zeros(size, dtype=bool)
+
+    def accept(self, h: float, error_ratio: float, order: int, points: Optional[np.ndarray] = None) -> float:
+        alpha = self.alpha_coef / (order + 1)
+        beta = self.beta_coef / (order + 1)
+        if points is not None:
+            return h * self._batch_factor(error_ratio, alpha, beta, order, points)
+        ratio = max(error_ratio, 1e-10)
+        if self.prev_ratio is None:
+            factor = self._factor(error_ratio, order, self.fac_max)
+        else:
+            factor = self.safety * ratio ** (-alpha) * self.prev_ratio ** beta
+            factor = min(self.fac_max, max(self.fac_min, factor))
+        if self.rejected_last:
+            factor = min(factor, 1.0)
+        self.prev_ratio = ratio
+        self.rejected_last = False
+        return h * factor
+
+    def reject(self, h: float, error_ratio: float, order: int, points: Optional[np.ndarray] = None) -> float:
+        if points is None:
+            self.rejected_last = True
+        else:
+            self.rejected_last[points] = True
+        return super().reject(h, error_ratio, order)
+
+    def _batch_factor(self, error_ratio: np.ndarray, alpha: float, beta: float, order: int,
+                      points: np.ndarray) -> np.ndarray:
+        """accept's step factor for the batch problems at points (their state is updated too)"""
+        ratio = np.maximum(error_ratio, 1e-10)
+        prev_ratio = self.prev_ratio[points]
+        factor = np.where(
+            np.isnan(prev_ratio),
+            self._factor(error_ratio, order, self.fac_max),
+            np.clip(self.safety * ratio ** (-alpha) * prev_ratio ** beta, self.fac_min, self.fac_max)
+        )
+        factor = np.where(self.rejected_last[points], np.minimum(factor, 1.0), factor)
+        self.prev_ratio[points] = ratio
+        self.rejected_last[points] = False
+        return factor
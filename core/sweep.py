@@ -0,0 +1,217 @@
+from typing import Callable, Optional
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import multiprocessing
+import time
+import os
+import numpy as np
+from . import ODEMethodInterface, StepSizeControllerInterface, ElementaryStepController
+from . import ODESolver, ReferenceSolver, MethodSelector
+
+
+
+class ParameterizedEquation:
+    """ODE right side with free parameters, compiled once with the parameters as arguments"""
+    def __init__(self, equation_str: str):
+        """
+        Parse the equation; every free symbol other than t and y is a parameter.
+        Args:
+            equation_str: Right side of y' = f(t, y, ...), e.g. "a*y + sin(b*t)".
+        """
+        import sympy as sp
+
+        self.equation_str = equation_str
+        self._t, self._y = sp.symbols("t y")
+        try:
+            self.expr = sp.sympify(equation_str)
+        except (sp.SympifyError, TypeError):
+            raise ValueError(f"Invalid equation: {equation_str}")
+        if not isinstance(self.expr, sp.Expr):
+            raise ValueError(f"Invalid equation: {equation_str}")
+
+        self._param_symbols = sorted(self.expr.free_symbols - {self._t, self._y}, key=lambda s: s.name)
+        self.params: list[str] = [s.name for s in self._param_symbols]
+        self.rhs = sp.lambdify((self._t, self._y, *self._param_symbols), self.expr, "numpy")
+        self._general_solution = None
+        self._general_solved = False
+
+    def bind(self, *param_values) -> Callable[[float, float], float]:
+        """Returns f(t, y) with the parameters fixed (values may be broadcast arrays)"""
+        rhs = self.rhs
+        return lambda t, y: rhs(t, y, *param_values)
+
+    def general_solution(self) -> Optional[Callable]:
+        """
+        Solve the ODE symbolically once, with the initial condition and parameters as arguments.
+        Returns:
+            Vectorized callable y(t, t0, y0, *params), or None if no solution is found.
+        """
+        if self._general_solved:
+            return self._general_solution
+        self._general_solved = True
+
+        import sympy as sp
+
+        t0, y0 = sp.symbols("t_0 y_0")
+        y_func = sp.Function("y")
+        try:
+            ode = sp.Eq(y_func(self._t).diff(self._t), self.expr.subs(self._y, y_func(self._t)))
+            solution = sp.dsolve(ode, y_func(self._t))
+            if isinstance(solution, list) or not hasattr(solution, "rhs"):
+                return None
+            constants = [s for s in solution.rhs.free_symbols
+                         if s != self._t and s not in self._param_symbols]
+            particular = solution.rhs
+            if constants:
+                values = sp.solve(particular.subs(self._t, t0) - y0, constants[0])
+                if not values:
+                    return None
+                particular = particular.subs(constants[0], values[0])
+            self._general_solution = sp.lambdify(
+                (self._t, t0, y0, *self._param_symbols), particular, "numpy"
+            )
+        except Exception as e:
+            print(f"Analytical solution error: {e}")
+        return self._general_solution
+
+
+@lru_cache(maxsize=8)
+def _compiled(equation_str: str) -> ParameterizedEquation:
+    # one compilation per worker process and equation
+    return ParameterizedEquation(equation_str)
+
+
+def parse_equation(equation_str: str, source: str = "equation") -> Callable[[float, float], float]:
+    """
+    Parse the right side of y' = f(t, y) (the parser shared by the GUI, the solve service and reports).
+    Args:
+        equation_str: Right side of the ODE, e.g. "t + y".
+        source: What the equation belongs to, named in error messages (e.g. "report 'stiff'").
+    Returns:
+        Callable f(t, y).
+    Raises:
+        ValueError: if the equation is invalid or has free symbols other than t and y.
+    """
+    try:
+        equation = _compiled(equation_str)
+    except ValueError:
+        raise ValueError(f"Invalid equation in {source}: {equation_str}")
+    if equation.params:
+        raise ValueError(f"Equation in {source} may only use t and y, found: {', '.join(equation.params)}")
+    return equation.bind()
+
+
+def _solve_chunk(equation_str: str, method: type[ODEMethodInterface], epsilon: float,
+                 y0: float, t0: float, t_end: float, max_iter: int,
+                 controller: type[StepSizeControllerInterface], param_values: list[np.ndarray]) -> np.ndarray:
+    """
+    Solve one chunk of the grid as a broadcast batch.
+    Returns y(t_end) for each point (NaN for points that diverge or cannot meet epsilon).
+    """
+    n_points = len(param_values[0]) if param_values else 1
+    equation = _compiled(equation_str)
+    return ODESolver.solve_batch(
+        lambda points: equation.bind(*[p[points] for p in param_values]),
+        method, epsilon, np.full(n_points, float(y0)), t0, t_end, max_iter, controller
+    )
+
+
+class ParameterSweep:
+    """Solve a parameterized ODE over a grid of parameter values"""
+    @staticmethod
+    def run(
+        equation_str: str,
+        grid: dict[str, np.ndarray],
+        method: Optional[type[ODEMethodInterface]],
+        epsilon: float,
+        y0: float,
+        t0: float,
+        t_end: float,
+        max_iter: int = None,
+        workers: Optional[int] = None,
+        chunk_size: int = 1024,
+        controller: type[StepSizeControllerInterface] = ElementaryStepController
+    ) -> dict:
+        """
+        Solve y' = f(t, y, params) for every point of the Cartesian product of the parameter values.
+        Args:
+            equation_str: Right side with free parameters, e.g. "a*y + sin(b*t)".
+            grid: Parameter name -> 1D array of values.
+            method: Numerical method cls for solving differential equations, or None to let
+                    MethodSelector pick it for the point in the middle of the grid.
+            epsilon: Desired accuracy.
+            y0: Initial value y(t0) (shared by all parameter points).
+            t0: Initial time.
+            t_end: End time.
+            max_iter: Maximum number of steps per chunk (step attempts per point for adaptive methods).
+            workers: Number of worker processes (defaults to the CPU count; 1 solves in this process).
+            chunk_size: Number of parameter points solved together as one broadcast batch.
+            controller: Step-size controller cls used by adaptive methods.
+        Returns:
+            dict with keys:
+                'params': parameter name -> flat array of values for each point,
+                'final_values': y(t_end) for each point (NaN for points that diverge or cannot meet epsilon),
+                'exact_values': exact y(t_end) for each point or None,
+                'errors': absolute errors for each point or None,
+                'execution_time': wall time in seconds,
+                'selected_method', 'selection_reason': the automatic method choice (None if method was given).
+        """
+        equation = ParameterizedEquation(equation_str)
+        missing = set(equation.params) - set(grid)
+        extra = set(grid) - set(equation.params)
+        if missing or extra:
+            raise ValueError(f"Parameter grid must define exactly: {', '.join(equation.params) or '-'}")
+        ODESolver._validate_inputs(y0, t0, t_end, epsilon)
+
+        axes = [np.asarray(grid[name], dtype=float).ravel() for name in equation.params]
+        mesh = [m.ravel() for m in np.meshgrid(*axes, indexing="ij")] if axes else []
+        n_points = len(mesh[0]) if mesh else 1
+        bounds = [(i, min(i + chunk_size, n_points)) for i in range(0, n_points, chunk_size)]
+        chunks = [[m[lo:hi] for m in mesh] for lo, hi in bounds]
+
+        start_time = time.time()
+        selection = None
+        if method is None:
+            middle = [m[len(m) // 2] for m in mesh]
+            selection = MethodSelector.select(equation.bind(*middle), epsilon, y0, t0, t_end,
+                                              10000 if max_iter is None else max_iter, controller)
+            method = selection.method
+        args = (equation_str, method, epsilon, y0, t0, t_end, max_iter, controller)
+        workers = (os.cpu_count() or 1) if workers is None else workers
+        if workers <= 1 or len(chunks) == 1:
+            results = [_solve_chunk(*args, chunk) for chunk in chunks]
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(chunks)),
+                                     mp_context=multiprocessing.get_context()) as pool:
+                results = list(pool.map(_solve_chunk, *zip(*[args + (chunk,) for chunk in chunks])))
+
+        final_values = np.concatenate(results)
+        exec_time = time.time() - start_time
+
+        exact_values, errors = None, None
+        solution = equation.general_solution()
+        if solution is not None:
+            with np.errstate(all="ignore"):
+                exact_values = np.array(np.broadcast_to(
+                    np.asarray(solution(t_end, t0, y0, *mesh), dtype=float), (n_points,)
+                ))
+            singular = np.flatnonzero(~np.isfinite(exact_values))
+            if len(singular):
+                # the general solution can be singular at some parameter values (e.g. a = b = 0
+                # in a*y + sin(b*t)); solve those points numerically with the reference accuracy
+                exact_values[singular] = ODESolver.solve_batch(
+                    lambda points: equation.bind(*[m[singular[points]] for m in mesh]),
+                    ReferenceSolver.method, ReferenceSolver.tolerance, np.full(len(singular), float(y0)),
+                    t0, t_end, ReferenceSolver.max_iter
+                )
+            errors = np.abs(final_values - exact_values)
+
+        return {
+            'params': dict(zip(equation.params, mesh)),
+            'final_values': final_values,
+            'exact_values': exact_values,
+            'errors': errors,
+            'execution_time': exec_time,
+            'selected_method': selection.method.display_name if selection else None,
+            'selection_reason': selection.reason if selection else None,
+        }
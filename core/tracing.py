@@ -0,0 +1,143 @@
+from typing import Callable, Optional
+from functools import wraps
+import threading
+import json
+import time
+import os
+
+
+
+class _Span:
+    """Records one complete ("X") trace event on exit"""
+    __slots__ = ("name", "cat", "args", "start")
+
+    def __init__(self, name: str, cat: str, args: Optional[dict]):
+        self.name, self.cat, self.args = name, cat, args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        args = self.args
+        if exc_type is not None:
+            args = dict(args or {}, error=exc_type.__name__)
+        Tracer._record(self.name, self.cat, self.start, end, args)
+        return False
+
+
+class _NullSpan:
+    """Shared no-op span returned while tracing is disabled"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """
+    Lightweight span tracer exporting Chrome/Perfetto trace-event JSON.
+    Disabled by default; while disabled, span() returns a shared no-op context manager
+    and traced functions only pay for one attribute check.
+    """
+    enabled: bool = False
+    max_events: int = 1_000_000
+    _events: list[dict] = []
+    _dropped: int = 0
+    _origin_ns: int = time.perf_counter_ns()
+    _thread_names: dict[int, str] = {}
+
+    @classmethod
+    def enable(cls) -> None:
+        cls.enabled = True
+
+    @classmethod
+    def disable(cls) -> None:
+        cls.enabled = False
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._events = []
+        cls._dropped = 0
+        cls._thread_names = {}
+        cls._origin_ns = time.perf_counter_ns()
+
+    @classmethod
+    def span(cls, name: str, cat: str = "app", **args):
+        """
+        Context manager timing a block of code.
+        Args:
+            name: Span name shown in the trace viewer.
+            cat: Event category.
+            args: Extra values attached to the event.
+        """
+        if not cls.enabled:
+            return _NULL_SPAN
+        return _Span(name, cat, args or None)
+
+    @classmethod
+    def traced(cls, name: str = None, cat: str = "app") -> Callable:
+        """Decorator wrapping every call of a function in a span (named after the function by default)"""
+        def decorator(func: Callable) -> Callable:
+            span_name = name or func.__qualname__
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if not cls.enabled:
+                    return func(*args, **kwargs)
+                with _Span(span_name, cat, None):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    @classmethod
+    def _record(cls, name: str, cat: str, start_ns: int, end_ns: int, args: Optional[dict]) -> None:
+        if len(cls._events) >= cls.max_events:
+            cls._dropped += 1
+            return
+        thread = threading.current_thread()
+        tid = thread.ident
+        if tid not in cls._thread_names:
+            cls._thread_names[tid] = thread.name
+        event = {
+            "name": name, "cat": cat, "ph": "X",
+            "ts": (start_ns - cls._origin_ns) / 1000, "dur": (end_ns - start_ns) / 1000,
+            "pid": os.getpid(), "tid": tid,
+        }
+        if args:
+            event["args"] = args
+        # list.append is atomic, so spans from solver threads need no lock
+        cls._events.append(event)
+
+    @classmethod
+    def to_dict(cls) -> dict:
+        """Returns the collected events in Chrome trace-event format"""
+        pid = os.getpid()
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": thread_name}}
+            for tid, thread_name in list(cls._thread_names.items())
+        ]
+        return {
+            "traceEvents": metadata + list(cls._events),
+            "displayTimeUnit": "ms",
+            "otherData": {"dropped_events": cls._dropped},
+        }
+
+    @classmethod
+    def export(cls, path: str) -> int:
+        """
+        Write collected events as Chrome/Perfetto trace JSON (open in chrome://tracing or ui.perfetto.dev).
+        Returns:
+            Number of exported events.
+        """
+        data = cls.to_dict()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, default=str)
+        return len(data["traceEvents"])
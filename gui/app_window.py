@@ -1,17 +1,23 @@
 import tkinter as tk
-from tkinter import Tk, ttk, messagebox
+from tkinter import Tk, ttk, messagebox, filedialog
+import threading
+import queue
 
 from .input_frame import InputFrame
 from .results_frame import ResultsFrame
 from .comparison_frame import ComparisonFrame
+from .sweep_frame import SweepFrame
 
-from core import ODESolver, GraphPlotter, MethodComparator
+from core import ODESolver, GraphPlotter, MethodComparator, ReferenceSolver, ParameterSweep, Tracer
 from utils.method_register import ODEMethodRegistry
 
 
 
 class ODESolverApp:
     """Main application class"""
+    # how often the Tk thread checks whether the reference solution is ready
+    REFERENCE_POLL_MS = 100
+
     def __init__(self, 
                  root: Tk, 
                  solver: ODESolver, 
@@ -20,7 +26,8 @@ class ODESolverApp:
                  input_frame_cls: InputFrame, 
                  result_frame_cls: ResultsFrame,
                  comparison_frame_cls: ComparisonFrame,
-                 plotter_cls: GraphPlotter
+                 plotter_cls: GraphPlotter,
+                 sweep_frame_cls: SweepFrame = SweepFrame
                  ):
         """
         Initialize the main ODE solver application.
@@ -33,6 +40,7 @@ class ODESolverApp:
             result_frame: Frame responsible for displaying numerical results and performance metrics.
             comparison_frame_cls: Frame responsible for comparing various methods.
             plotter_cls: Class responsible for rendering solution plots.
+            sweep_frame_cls: Frame responsible for parameter grid sweeps.
         """
         self.root = root
         self.root.title("Розв'язання Диференціальних рівнянь")
@@ -41,8 +49,12 @@ class ODESolverApp:
         self.solver: ODESolver = solver
         self.register: ODEMethodRegistry = register
         self.comparator: MethodComparator = comparator
+        self._live_running = False
+        # identifies the calculation whose reference solution is awaited (see _show_reference)
+        self._reference_token = None
 
         self._configure_style()
+        self._create_menu()
 
         main_frame = ttk.Frame(root, padding="10")
         main_frame.pack(fill=tk.BOTH, expand=True)
@@ -57,18 +69,21 @@ class ODESolverApp:
         self.tab1 = ttk.Frame(self.tab_control)
         self.tab2 = ttk.Frame(self.tab_control)
         self.tab3 = ttk.Frame(self.tab_control)
+        self.tab4 = ttk.Frame(self.tab_control)
 
         self.tab_control.add(self.tab1, text='Вхідні дані')
         self.tab_control.add(self.tab2, text='Результати')
         self.tab_control.add(self.tab3, text='Порівняння методів')
+        self.tab_control.add(self.tab4, text='Параметри')
 
-        for tab in (self.tab1, self.tab2, self.tab3):
+        for tab in (self.tab1, self.tab2, self.tab3, self.tab4):
             tab.columnconfigure(0, weight=1)
             tab.rowconfigure(0, weight=1)
 
         self.input_frame: InputFrame = input_frame_cls(self.tab1, self.calculate, self.register.get_method_choices())
         self.results_frame: ResultsFrame = result_frame_cls(self.tab2, plotter_cls)
         self.comparison_frame: ComparisonFrame = comparison_frame_cls(self.tab3, plotter_cls)
+        self.sweep_frame: SweepFrame = sweep_frame_cls(self.tab4, self.run_sweep)
 
     def _configure_style(self):
         style = ttk.Style()
@@ -79,36 +94,176 @@ class ODESolverApp:
         style.configure('TButton', padding=5, font=('Helvetica', 9))
         style.configure('Header.TLabel', font=('Helvetica', 11, 'bold'))
 
+    def _create_menu(self):
+        menubar = tk.Menu(self.root)
+        trace_menu = tk.Menu(menubar, tearoff=0)
+        self.trace_var = tk.BooleanVar(value=Tracer.enabled)
+        trace_menu.add_checkbutton(label="Записувати трасування", variable=self.trace_var, command=self._toggle_tracing)
+        trace_menu.add_command(label="Експортувати трасування...", command=self._export_trace)
+        trace_menu.add_command(label="Очистити трасування", command=Tracer.clear)
+        menubar.add_cascade(label="Трасування", menu=trace_menu)
+        self.root.config(menu=menubar)
+
+    def _toggle_tracing(self):
+        if self.trace_var.get():
+            Tracer.enable()
+        else:
+            Tracer.disable()
+
+    def _export_trace(self):
+        path = filedialog.asksaveasfilename(
+            defaultextension=".json", filetypes=[("Chrome trace", "*.json")], initialfile="trace.json"
+        )
+        if path:
+            try:
+                count = Tracer.export(path)
+                messagebox.showinfo("Трасування", f"Збережено {count} подій у {path}")
+            except OSError as e:
+                messagebox.showerror("Помилка", str(e))
+
     def calculate(self):
+        if self._live_running:
+            return
+        with Tracer.span("ODESolverApp.calculate", cat="gui"):
+            self._calculate()
+
+    def _calculate(self):
         try:
             function = self.input_frame.get_function()
             params = self.input_frame.get_inputs()
             y0, t0, t_end, eps, max_iter, method_id = params.values()
+            # None for the automatic choice: the solver picks the method
             method = self.register.get_method(method_id)
 
             # analytical solution
             equation_str = self.input_frame.get_equation()
-            analytical_func, analytical_equation_str = self.solver.solve_analytical(equation_str, (t0, y0))
-            if analytical_func:
+            analytical = self.solver.solve_analytical(equation_str, (t0, y0))
+            self._reference_token = token = object()
+            reference_args = None
+            if analytical:
+                analytical_func, analytical_equation_str = analytical
                 self.results_frame.set_analytical_solution(analytical_func, equation_str, analytical_equation_str)
                 self.comparison_frame.set_analytical_solution(analytical_func)
+            else:
+                # no exact solution: errors are measured against a high-accuracy reference,
+                # computed off the Tk thread after the main solve
+                reference_args = (function, equation_str, y0, t0, t_end)
+                self.results_frame.set_reference_pending(equation_str)
+                self.comparison_frame.set_analytical_solution(None)
+
+            if self.input_frame.is_live_mode():
+                self._calculate_live(function, equation_str, method, eps, y0, t0, t_end, max_iter,
+                                     reference_args, token)
+                return
 
-            # solve numerically
+            # solve numerically (quadrature-type and linear equations take a structured fast path)
+            stats = {}
             ts, ys, exec_time = self.solver.solve(
                 function=function,
                 epsilon=eps,
                 method=method,
                 y0=y0, t0=t0, t_end=t_end,
-                max_iter=max_iter
+                max_iter=max_iter,
+                stats=stats,
+                equation=equation_str
             )
             # update results
-            self.results_frame.update_results(ts, ys, exec_time)
+            self.results_frame.update_results(ts, ys, exec_time, stats['path'], stats.get('selection_reason'))
             self.compare_methods()
             self.tab_control.select(self.tab2)
 
+            if reference_args is not None:
+                reference_queue = queue.Queue()
+                threading.Thread(target=self._compute_reference, args=(reference_queue, *reference_args),
+                                 daemon=True).start()
+                self._show_reference(reference_queue, equation_str, token)
+
         except Exception as e:
             messagebox.showerror("Помилка", str(e))
-    
+
+    @staticmethod
+    def _compute_reference(reference_queue: queue.Queue, function, equation_str, y0, t0, t_end):
+        """Worker-thread part of the reference solution: computes it and puts it on the queue"""
+        reference_queue.put(ReferenceSolver.get_reference(function, equation_str, y0, t0, t_end))
+
+    def _show_reference(self, reference_queue: queue.Queue, equation_str: str, token: object):
+        """Hands the reference solution to the frames once it is ready (dropped if a newer calculation started)"""
+        if token is not self._reference_token:
+            return
+        try:
+            reference = reference_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(self.REFERENCE_POLL_MS, self._show_reference, reference_queue, equation_str, token)
+            return
+        self.results_frame.set_reference_solution(reference, equation_str)
+        self.results_frame.refresh_analytical()
+        self.comparison_frame.set_analytical_solution(reference)
+        self.comparison_frame.refresh_errors()
+
+    def _calculate_live(self, function, equation_str, method, eps, y0, t0, t_end, max_iter,
+                        reference_args=None, token=None):
+        """
+        Solve in a background thread while the results tab plots accepted steps as they arrive
+        (the same thread then computes the reference solution if reference_args are given)
+        """
+        chunk_queue = queue.Queue()
+        reference_queue = queue.Queue()
+
+        def worker():
+            try:
+                stats = {}
+                ts, ys, exec_time = self.solver.solve(
+                    function=function,
+                    epsilon=eps,
+                    method=method,
+                    y0=y0, t0=t0, t_end=t_end,
+                    max_iter=max_iter,
+                    on_chunk=lambda c_ts, c_ys: chunk_queue.put(("chunk", c_ts, c_ys)),
+                    stats=stats,
+                    equation=equation_str
+                )
+                chunk_queue.put(("done", ts, ys, exec_time, stats['path'], stats.get('selection_reason')))
+            except Exception as e:
+                chunk_queue.put(("error", e))
+                return
+            if reference_args is not None:
+                self._compute_reference(reference_queue, *reference_args)
+
+        def on_finished(error):
+            self._live_running = False
+            if error is not None:
+                messagebox.showerror("Помилка", str(error))
+            else:
+                self.compare_methods()
+                if reference_args is not None:
+                    self._show_reference(reference_queue, equation_str, token)
+
+        self._live_running = True
+        self.tab_control.select(self.tab2)
+        self.results_frame.start_live(chunk_queue, t0, t_end, on_finished)
+        threading.Thread(target=worker, daemon=True).start()
+
+    @Tracer.traced("ODESolverApp.run_sweep", cat="gui")
+    def run_sweep(self):
+        """Solve the parameterized equation over the parameter grid"""
+        try:
+            params = self.input_frame.get_inputs()
+            y0, t0, t_end, eps, max_iter, method_id = params.values()
+            results = ParameterSweep.run(
+                equation_str=self.input_frame.get_equation(),
+                grid=self.sweep_frame.get_grid(),
+                method=self.register.get_method(method_id),
+                epsilon=eps,
+                y0=y0, t0=t0, t_end=t_end,
+                max_iter=max_iter,
+                workers=self.sweep_frame.get_workers()
+            )
+            self.sweep_frame.update_results(results)
+
+        except Exception as e:
+            messagebox.showerror("Помилка", str(e))
+
+    @Tracer.traced("ODESolverApp.compare_methods", cat="gui")
     def compare_methods(self):
         """Compare all methods for current problem"""
         try:
@@ -1,7 +1,8 @@
 import tkinter as tk
 from tkinter import ttk
-import numpy as np
 from core.plotter import GraphPlotter
+from core.comparison import MethodComparator
+from core.tracing import Tracer
 
 
 class ComparisonFrame:
@@ -19,6 +20,7 @@ class ComparisonFrame:
         self.frame.grid(row=0, column=0, sticky="nsew", padx=20, pady=20)
         
         self.analytical_solution = None
+        self.results = None
         self._create_widgets()
 
     def _create_widgets(self):
@@ -28,14 +30,15 @@ class ComparisonFrame:
         title_label.grid(row=0, column=0, columnspan=2, pady=10)
         
         # results table
-        cols = ("Метод", "Час виконання (с)", "Кількість точок", "Макс. похибка", "Середня похибка")
+        cols = ("Метод", "Час виконання (с)", "Кількість точок", "Відхилені кроки", "Обчислення f",
+                "Макс. похибка", "Середня похибка")
         self.comp_tree = ttk.Treeview(self.frame, columns=cols, show="headings", height=8)
         for col in cols:
             self.comp_tree.heading(col, text=col)
             if col == "Метод":
                 self.comp_tree.column(col, width=120)
             else:
-                self.comp_tree.column(col, width=110)
+                self.comp_tree.column(col, width=100)
         self.comp_tree.grid(row=1, column=0, columnspan=2, sticky="nsew", pady=10)
         
         # scrollbar
@@ -55,50 +58,50 @@ class ComparisonFrame:
         """Set the analytical solution function for error calculation"""
         self.analytical_solution = analytical_func
 
+    def refresh_errors(self):
+        """Recompute the errors of the shown results after the analytical (or reference) solution has been set"""
+        if self.results is not None:
+            self.update_comparison_results(self.results)
+
+    @Tracer.traced("ComparisonFrame.update_comparison_results", cat="gui")
     def update_comparison_results(self, results: dict):
         """
         Update comparison results table and plot with error analysis
         Args:
             results: Dictionary with method names as keys and results as values
         """
+        self.results = results
         for row in self.comp_tree.get_children():
             self.comp_tree.delete(row)
 
-        error_results = {}
+        #  calc errors
+        with Tracer.span("MethodComparator.compute_errors", cat="gui"):
+            error_results = MethodComparator.compute_errors(results, self.analytical_solution)
         for method_name, result in results.items():
-            ts, ys = result['solution']
-            
-            if self.analytical_solution:
-                analytical_ys = np.array([self.analytical_solution(t) for t in ts])
-                
-                #  calc errors
-                errors = np.abs(analytical_ys - ys)
-                max_error = np.max(errors) if len(errors) > 0 else 0
-                mean_error = np.mean(errors) if len(errors) > 0 else 0
-
-                error_results[method_name] = {
-                    'ts': ts,
-                    'errors': errors,
-                    'execution_time': result['execution_time'],
-                    'num_points': result['num_points'],
-                    'max_error': max_error,
-                    'mean_error': mean_error
-                }
+            if method_name in error_results:
+                max_error = error_results[method_name]['max_error']
+                mean_error = error_results[method_name]['mean_error']
                 # update table
                 self.comp_tree.insert("", tk.END, values=(
                     method_name,
                     f"{result['execution_time']:.6f}",
                     result['num_points'],
+                    result.get('rejected_steps', "-"),
+                    result.get('rhs_evaluations', "-"),
                     f"{max_error:.6f}",
                     f"{mean_error:.6f}"
                 ))
-                # update plot
-                self.res_plotter.update_comparison_graph(error_results)
             else:
                 self.comp_tree.insert("", tk.END, values=(
                     method_name,
                     f"{result['execution_time']:.6f}",
                     result['num_points'],
+                    result.get('rejected_steps', "-"),
+                    result.get('rhs_evaluations', "-"),
                     "N/A",
                     "N/A"
-                ))
\ No newline at end of file
+                ))
+
+        # update plot
+        if error_results:
+            self.res_plotter.update_comparison_graph(error_results)
\ No newline at end of file
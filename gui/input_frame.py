@@ -2,8 +2,8 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import Callable
 
-from sympy import sympify, symbols, lambdify
-from sympy.core.sympify import SympifyError
+from core.tracing import Tracer
+from core.sweep import parse_equation
 
 
 
@@ -87,6 +87,12 @@ class InputFrame:
             self.method_combo.current(0)
         row += 1
 
+        # live plot
+        self.live_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(self.frame, text="Графік у процесі обчислення", variable=self.live_var).grid(
+            row=row, column=0, columnspan=2, sticky="w")
+        row += 1
+
         # calc
         calc_btn = ttk.Button(self.frame, text="Обчислити", command=self.calculate_callback)
         calc_btn.grid(row=row, column=0, columnspan=2, pady=15, sticky="ew")
@@ -140,6 +146,11 @@ class InputFrame:
         if max_steps and max_steps <= 0:
             raise ValueError("Максимальна кількість кроків має бути додатною")
 
+    def is_live_mode(self) -> bool:
+        """Returns True if the solution should be plotted while it is being computed"""
+        return self.live_var.get()
+
+    @Tracer.traced("InputFrame.get_function", cat="gui")
     def get_function(self) -> Callable[[float, float], float]:
         """
         Parse the user input equation string into a callable function f(t, y).
@@ -147,14 +158,11 @@ class InputFrame:
             allable f(t, y) representing the ODE y' = f(t, y).
         """
         expr_str = self.eq_entry.get()
-        t, y = symbols("t y")
         try:
-            expr = sympify(expr_str)
-            func = lambdify((t, y), expr, "numpy")
-            return func
-        except SympifyError:
+            return parse_equation(expr_str, "the input form")
+        except ValueError:
             messagebox.showerror("Помилка", f"Неправильне рівняння: {expr_str}")
-            raise ValueError(f"Invalid equation: {expr_str}")
+            raise
         
     def get_equation(self) -> str:
         """
@@ -1,13 +1,26 @@
-import tkinter as tk
-from tkinter import ttk
+from tkinter import ttk, messagebox
 import numpy as np
+import queue
 from core.plotter import GraphPlotter
-from typing import Callable
+from core.solver import ODESolver
+from core.tracing import Tracer
+from typing import Callable, Optional
+
+from .virtual_table import VirtualTable
 
 
 
 class ResultsFrame:
     """Frame for displaying results and plot"""
+    # live plot refresh period and per-frame budget of chunks taken from the queue
+    LIVE_INTERVAL_MS = 50
+    LIVE_MAX_CHUNKS = 64
+    PATH_LABELS = {
+        "general": "покроковий метод",
+        "quadrature": "квадратура (y' = g(t))",
+        "linear": "інтегрувальний множник (лінійне рівняння)",
+    }
+
     def __init__(self, parent, plotter_cls: GraphPlotter):
         """
         Initialize the results frame for numerical solution display and plotting.
@@ -21,6 +34,8 @@ class ResultsFrame:
         self.frame.grid(row=0, column=0, sticky="nsew", padx=20, pady=20)
         
         self.analytical_solution = None
+        self.ts = np.array([])
+        self.ys = np.array([])
         self._create_widgets()
 
     def _create_widgets(self):
@@ -31,18 +46,30 @@ class ResultsFrame:
         # analytical solution label
         self.analytical_label = ttk.Label(self.frame, text="Точний розв'язок: не знайдено")
         self.analytical_label.grid(row=1, column=0, sticky="w")
+
+        # why the automatic method selection picked a method (shown only for "Авто")
+        self.selection_label = ttk.Label(self.frame, text="", wraplength=900, justify="left")
+        self.selection_label.grid(row=5, column=0, columnspan=2, sticky="w")
         
-        # results table
+        # jump to t
+        search_frame = ttk.Frame(self.frame)
+        search_frame.grid(row=2, column=0, columnspan=2, sticky="ew", pady=(10, 0))
+        ttk.Label(search_frame, text="Перейти до t:").pack(side="left")
+        self.search_entry = ttk.Entry(search_frame, width=12)
+        self.search_entry.pack(side="left", padx=5)
+        self.search_entry.bind("<Return>", lambda e: self.jump_to_t())
+        ttk.Button(search_frame, text="Перейти", command=self.jump_to_t).pack(side="left")
+        self.points_label = ttk.Label(search_frame, text="Точок: 0")
+        self.points_label.pack(side="right")
+
+        # results table (rows are rendered only for the visible window)
         cols = ("t", "y(t)", "y_точне(t)", "похибка")
-        self.tree = ttk.Treeview(self.frame, columns=cols, show="headings", height=5)
-        for col in cols:
-            self.tree.heading(col, text=col)
-            self.tree.column(col, width=100)
-        self.tree.grid(row=2, column=0, columnspan=2, sticky="nsew", pady=10)
+        self.table = VirtualTable(self.frame, cols, page_size=10)
+        self.table.grid(row=3, column=0, columnspan=2, sticky="nsew", pady=10)
         
         # graph
         self.plotter: GraphPlotter = self.plotter_cls(master=self.frame, figsize=(8, 4),
-                                        row=3, column=0, sticky="nsew")
+                                        row=4, column=0, sticky="nsew")
         self.frame.rowconfigure(1, weight=1)
         self.frame.columnconfigure(0, weight=1)
         self.frame.columnconfigure(1, weight=1)
@@ -53,36 +80,129 @@ class ResultsFrame:
         if analytical_func:
             self.analytical_label.config(text=f"Точний розв'язок для y' = {equation_str}   ->   {analytical_equation_str}")
 
-    def update_results(self, ts: np.ndarray, ys: np.ndarray, exec_time: float):
-        """Updates table and graph with numerical results"""
+    def set_reference_solution(self, reference: Optional[Callable], equation_str: str):
+        """Set a numerical reference solution used in place of the exact one"""
+        self.analytical_solution = reference
+        if reference:
+            self.analytical_label.config(
+                text=f"Точний розв'язок для y' = {equation_str} не знайдено, еталонний розв'язок: {reference.describe()}")
+        else:
+            self.analytical_label.config(text="Точний розв'язок: не знайдено")
+
+    def set_reference_pending(self, equation_str: str):
+        """Show results without errors while the reference solution is being computed"""
+        self.analytical_solution = None
+        self.analytical_label.config(
+            text=f"Точний розв'язок для y' = {equation_str} не знайдено, еталонний розв'язок: обчислення...")
+
+    def refresh_analytical(self):
+        """Redraws the table and the graph after the exact (or reference) solution has been set"""
+        if len(self.ts) == 0:
+            return
+        self.table.set_data(len(self.ts), self._get_rows)
+        self.plotter.update_graph(self.ts, self.ys, y_label="y", x_label="t",
+                                  analytical_ys=self._evaluate_analytical(self.ts))
+
+    @Tracer.traced("ResultsFrame.update_results", cat="gui")
+    def update_results(self, ts: np.ndarray, ys: np.ndarray, exec_time: float, path: str = None,
+                       selection_reason: str = None):
+        """
+        Updates table and graph with numerical results
+        (path is the solver path that was used, selection_reason explains an automatic method choice)
+        """
         # update execution time
-        self.time_label.config(text=f"Час виконання: {exec_time:.6f} с")
+        text = f"Час виконання: {exec_time:.6f} с"
+        if path is not None:
+            text += f"   Шлях розв'язання: {self.PATH_LABELS.get(path, path)}"
+        self.time_label.config(text=text)
+        self.selection_label.config(text=selection_reason or "")
         
         # update table
-        for row in self.tree.get_children():
-            self.tree.delete(row)
-            
-        analytical_ys = None
-        if self.analytical_solution:
-            try:
-                analytical_ys = np.array([self.analytical_solution(t) for t in ts])
-            except:
-                analytical_ys = None
-                
-        step = max(1, len(ts) // 20)  # show at most 20 points
-        for i in range(0, len(ts), step):
-            t, y_num = ts[i], ys[i]
-            if analytical_ys is not None:
-                y_analytical = analytical_ys[i]
-                error = abs(y_analytical - y_num)
-                self.tree.insert("", tk.END, values=(
-                    f"{t:.4f}", f"{y_num:.6f}", f"{y_analytical:.6f}", f"{error:.6f}"
-                ))
-            else:
-                self.tree.insert("", tk.END, values=(
-                    f"{t:.4f}", f"{y_num:.6f}", "-", "-"
-                ))
+        self.ts, self.ys = ts, ys
+        self.points_label.config(text=f"Точок: {len(ts)}")
+        self.table.set_data(len(ts), self._get_rows)
         
         # update graph
+        with Tracer.span("ResultsFrame.evaluate_analytical", cat="gui", points=len(ts)):
+            analytical_ys = self._evaluate_analytical(ts)
         self.plotter.update_graph(ts, ys, y_label="y", x_label="t", 
-                                 analytical_ys=analytical_ys if analytical_ys is not None else None)
\ No newline at end of file
+                                 analytical_ys=analytical_ys)
+
+    def start_live(self, chunk_queue: queue.Queue, t0: float, t_end: float,
+                   on_finished: Callable[[Optional[Exception]], None]):
+        """
+        Show the solution while it is being computed.
+        Args:
+            chunk_queue: Queue receiving ("chunk", ts, ys) items, then ("done", ts, ys, exec_time, path,
+                         selection_reason)
+                         or ("error", exception).
+            t0: Initial time.
+            t_end: End time.
+            on_finished: Called with None when the solve is done, or with the raised exception.
+        """
+        self.time_label.config(text="Час виконання: обчислення...")
+        self.selection_label.config(text="")
+        analytical_ts = np.linspace(t0, t_end, 200)
+        analytical_ys = self._evaluate_analytical(analytical_ts)
+        self.plotter.start_live(t0, t_end, y_label="y", x_label="t",
+                                analytical_ts=analytical_ts, analytical_ys=analytical_ys)
+        self.frame.after(self.LIVE_INTERVAL_MS, self._poll_live, chunk_queue, on_finished)
+
+    def _poll_live(self, chunk_queue: queue.Queue, on_finished: Callable[[Optional[Exception]], None]):
+        """Moves queued chunks to the plot; at most LIVE_MAX_CHUNKS per frame so UI work stays bounded"""
+        new_ts, new_ys = [], []
+        final = None
+        for _ in range(self.LIVE_MAX_CHUNKS):
+            try:
+                item = chunk_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item[0] == "chunk":
+                new_ts.append(item[1])
+                new_ys.append(item[2])
+            else:
+                final = item
+                break
+
+        if new_ts:
+            self.plotter.append_live(np.concatenate(new_ts), np.concatenate(new_ys))
+        if final is None:
+            self.frame.after(self.LIVE_INTERVAL_MS, self._poll_live, chunk_queue, on_finished)
+        elif final[0] == "done":
+            self.update_results(*final[1:])
+            on_finished(None)
+        else:
+            self.plotter.finish_live()
+            on_finished(final[1])
+
+    def jump_to_t(self):
+        """Scroll the table to the point closest to the entered t"""
+        if len(self.ts) == 0:
+            return
+        try:
+            t = float(self.search_entry.get())
+        except ValueError:
+            messagebox.showerror("Помилка", "t має бути числом")
+            return
+        # ts is sorted, so binary search finds the neighbours of t
+        idx = int(np.searchsorted(self.ts, t))
+        if idx == len(self.ts) or (idx > 0 and t - self.ts[idx - 1] <= self.ts[idx] - t):
+            idx -= 1
+        self.table.show_row(idx)
+
+    def _get_rows(self, start: int, stop: int) -> list[tuple]:
+        """Formats table rows for the window [start, stop), computing exact values lazily"""
+        ts, ys = self.ts[start:stop], self.ys[start:stop]
+        analytical_ys = self._evaluate_analytical(ts)
+        if analytical_ys is None:
+            return [(f"{t:.4f}", f"{y_num:.6f}", "-", "-") for t, y_num in zip(ts, ys)]
+        return [
+            (f"{t:.4f}", f"{y_num:.6f}", f"{y_analytical:.6f}", f"{abs(y_analytical - y_num):.6f}")
+            for t, y_num, y_analytical in zip(ts, ys, analytical_ys)
+        ]
+
+    def _evaluate_analytical(self, ts: np.ndarray) -> Optional[np.ndarray]:
+        """Evaluates the analytical (or reference) solution at ts"""
+        if not self.analytical_solution:
+            return None
+        return ODESolver.evaluate_solution(self.analytical_solution, ts)
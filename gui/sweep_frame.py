@@ -0,0 +1,113 @@
+from tkinter import ttk
+import numpy as np
+from typing import Callable
+
+from core.tracing import Tracer
+from .virtual_table import VirtualTable
+
+
+
+class SweepFrame:
+    """Frame for solving a parameterized equation over a parameter grid"""
+    def __init__(self, parent, sweep_callback: Callable):
+        """
+        Initialize the parameter sweep frame.
+        Args:
+            parent: Parent Tkinter widget where this frame is placed.
+            sweep_callback: Function to be called when the user starts the sweep.
+        """
+        self.parent = parent
+        self.sweep_callback = sweep_callback
+        self.frame = ttk.Frame(parent)
+        self.frame.grid(row=0, column=0, sticky="nsew", padx=20, pady=20)
+
+        self.results = None
+        self._create_widgets()
+
+    def _create_widgets(self):
+        # hint
+        ttk.Label(self.frame, text="Рівняння з параметрами вводиться на вкладці вхідних даних, напр. y' = a*y + sin(b*t)"
+                  ).grid(row=0, column=0, columnspan=3, sticky="w")
+
+        # parameter grid
+        ttk.Label(self.frame, text="Сітка параметрів:").grid(row=1, column=0, sticky="w")
+        self.grid_entry = ttk.Entry(self.frame)
+        self.grid_entry.grid(row=1, column=1, sticky="ew", padx=5)
+        self.grid_entry.insert(0, "a = -1:1:50; b = 0:2:50")
+        ttk.Button(self.frame, text="Обчислити", command=self.sweep_callback).grid(row=1, column=2)
+
+        ttk.Label(self.frame, text="(початок:кінець:кількість або список значень через кому)"
+                  ).grid(row=2, column=1, sticky="w")
+
+        # workers
+        ttk.Label(self.frame, text="Процесів (opt.):").grid(row=3, column=0, sticky="w")
+        self.workers_entry = ttk.Entry(self.frame, width=8)
+        self.workers_entry.grid(row=3, column=1, sticky="w", padx=5)
+
+        self.time_label = ttk.Label(self.frame, text="Час виконання: -")
+        self.time_label.grid(row=4, column=0, columnspan=3, sticky="w", pady=(10, 0))
+
+        # summary table
+        self.table = VirtualTable(self.frame, ("y(t_end)", "y_точне(t_end)", "похибка"), page_size=15)
+        self.table.grid(row=5, column=0, columnspan=3, sticky="nsew", pady=10)
+
+        self.frame.rowconfigure(5, weight=1)
+        self.frame.columnconfigure(1, weight=1)
+
+    def get_grid(self) -> dict[str, np.ndarray]:
+        """
+        Parse the parameter grid, e.g. "a = -1:1:50; b = 0.5, 1, 2".
+        Returns:
+            Parameter name -> array of values.
+        """
+        grid = {}
+        for part in self.grid_entry.get().split(";"):
+            if not part.strip():
+                continue
+            if "=" not in part:
+                raise ValueError(f"Некоректний опис параметра: {part.strip()}")
+            name, values = (s.strip() for s in part.split("=", 1))
+            if not name.isidentifier():
+                raise ValueError(f"Некоректна назва параметра: {name}")
+            if ":" in values:
+                start, stop, count = values.split(":")
+                if int(count) <= 0:
+                    raise ValueError(f"Кількість значень параметра {name} має бути додатною")
+                grid[name] = np.linspace(float(start), float(stop), int(count))
+            else:
+                grid[name] = np.array([float(v) for v in values.split(",")])
+        return grid
+
+    def get_workers(self) -> int:
+        """Returns the requested number of worker processes (None for the default)"""
+        workers_str = self.workers_entry.get().strip()
+        return int(workers_str) if workers_str else None
+
+    @Tracer.traced("SweepFrame.update_results", cat="gui")
+    def update_results(self, results: dict):
+        """Updates the summary table with final values and errors for each parameter point"""
+        self.results = results
+        n_points = len(results['final_values'])
+        text = f"Час виконання: {results['execution_time']:.6f} с   Точок сітки: {n_points}"
+        if results.get('selected_method'):
+            text += f"   Метод: {results['selected_method']}"
+        self.time_label.config(text=text)
+        self.table.set_columns(tuple(results['params']) + ("y(t_end)", "y_точне(t_end)", "похибка"))
+        self.table.set_data(n_points, self._get_rows)
+
+    def _get_rows(self, start: int, stop: int) -> list[tuple]:
+        results = self.results
+        params = [values[start:stop] for values in results['params'].values()]
+        finals = results['final_values'][start:stop]
+        exact = results['exact_values'][start:stop] if results['exact_values'] is not None else None
+        errors = results['errors'][start:stop] if results['errors'] is not None else None
+
+        rows = []
+        for i in range(stop - start):
+            row = [f"{values[i]:.4g}" for values in params] + [f"{finals[i]:.6f}"]
+            if exact is not None:
+                row += [f"{exact[i]:.6f}", f"{errors[i]:.6g}"]
+            else:
+                row += ["-", "-"]
+            rows.append(tuple(row))
+        return rows
@@ -0,0 +1,113 @@
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable
+
+from core.tracing import Tracer
+
+
+
+class VirtualTable:
+    """Paged Treeview that only creates rows for the visible window"""
+    def __init__(self, parent, columns: tuple[str, ...], page_size: int = 10, column_width: int = 100):
+        """
+        Initialize the table widgets.
+        Args:
+            parent: Parent Tkinter widget where the table is placed.
+            columns: Column headings.
+            page_size: Number of visible rows (and Treeview items ever created).
+            column_width: Width of each column in pixels.
+        """
+        self.page_size = page_size
+        self.row_count = 0
+        self.offset = 0
+        self.row_provider: Callable[[int, int], list[tuple]] = lambda start, stop: []
+
+        self.frame = ttk.Frame(parent)
+        self.column_width = column_width
+        self.tree = ttk.Treeview(self.frame, columns=columns, show="headings", height=page_size)
+        self.set_columns(columns)
+        self.tree.grid(row=0, column=0, sticky="nsew")
+
+        # scrollbar drives the window offset, not the Treeview itself
+        self.scrollbar = ttk.Scrollbar(self.frame, orient="vertical", command=self._on_scroll)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        self.frame.columnconfigure(0, weight=1)
+        self.frame.rowconfigure(0, weight=1)
+
+        self.items = [self.tree.insert("", tk.END, values=()) for _ in range(page_size)]
+        for item in self.items:
+            self.tree.detach(item)
+
+        for widget in (self.tree, self.scrollbar):
+            widget.bind("<MouseWheel>", self._on_mousewheel)
+            widget.bind("<Button-4>", lambda e: self.scroll_to(self.offset - 3))
+            widget.bind("<Button-5>", lambda e: self.scroll_to(self.offset + 3))
+        self.tree.bind("<Prior>", lambda e: self.scroll_to(self.offset - self.page_size))
+        self.tree.bind("<Next>", lambda e: self.scroll_to(self.offset + self.page_size))
+
+    def grid(self, **kwargs):
+        self.frame.grid(**kwargs)
+
+    def set_columns(self, columns: tuple[str, ...]):
+        """Replace column headings"""
+        self.tree.configure(columns=columns)
+        for col in columns:
+            self.tree.heading(col, text=col)
+            self.tree.column(col, width=self.column_width)
+
+    def set_data(self, row_count: int, row_provider: Callable[[int, int], list[tuple]]):
+        """
+        Replace table contents.
+        Args:
+            row_count: Total number of rows.
+            row_provider: Callable (start, stop) returning the row values for that range.
+        """
+        self.row_count = row_count
+        self.row_provider = row_provider
+        self.offset = 0
+        self.refresh()
+
+    def scroll_to(self, offset: int):
+        """Show the window starting at the given row"""
+        max_offset = max(0, self.row_count - self.page_size)
+        offset = min(max(0, int(offset)), max_offset)
+        if offset != self.offset:
+            self.offset = offset
+            self.refresh()
+        return "break"
+
+    def show_row(self, index: int):
+        """Scroll so that the row is visible and select it"""
+        self.scroll_to(index)
+        position = index - self.offset
+        if 0 <= position < self.page_size and index < self.row_count:
+            self.tree.selection_set(self.items[position])
+
+    @Tracer.traced("VirtualTable.refresh", cat="gui")
+    def refresh(self):
+        """Re-render the visible window"""
+        stop = min(self.offset + self.page_size, self.row_count)
+        rows = self.row_provider(self.offset, stop) if stop > self.offset else []
+        self.tree.selection_remove(self.tree.selection())
+        for position, item in enumerate(self.items):
+            if position < len(rows):
+                self.tree.item(item, values=rows[position])
+                self.tree.move(item, "", position)
+            else:
+                self.tree.detach(item)
+
+        if self.row_count > 0:
+            self.scrollbar.set(self.offset / self.row_count, stop / self.row_count)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def _on_scroll(self, action: str, amount: str, unit: str = None):
+        if action == "moveto":
+            self.scroll_to(round(float(amount) * self.row_count))
+        elif action == "scroll":
+            step = self.page_size if unit == "pages" else 1
+            self.scroll_to(self.offset + int(amount) * step)
+
+    def _on_mousewheel(self, event):
+        direction = -1 if event.delta > 0 else 1
+        return self.scroll_to(self.offset + 3 * direction)
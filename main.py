@@ -1,11 +1,12 @@
 from tkinter import Tk
-from gui.app_window import ODESolverApp, InputFrame, ResultsFrame, ComparisonFrame
+from gui.app_window import ODESolverApp, InputFrame, ResultsFrame, ComparisonFrame, SweepFrame
 
 from core import ode_solve_methods, ODESolver, GraphPlotter, MethodComparator
 from utils.method_register import ODEMethodRegistry
 
 for method in ode_solve_methods:
     ODEMethodRegistry.register(method)
+ODEMethodRegistry.register_auto()
 
 
 
@@ -19,6 +20,7 @@ if __name__ == '__main__':
                     input_frame_cls=InputFrame,
                     result_frame_cls=ResultsFrame,
                     comparison_frame_cls = ComparisonFrame,
-                    plotter_cls=GraphPlotter
+                    plotter_cls=GraphPlotter,
+                    sweep_frame_cls=SweepFrame
                     )
     root.mainloop()
@@ -0,0 +1,2 @@
+from .jobs import JobManager, QueueFullError, parse_equation
+from .server import SolveServer, SolveRequestHandler
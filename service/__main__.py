@@ -0,0 +1,25 @@
+import argparse
+
+from .jobs import JobManager
+from .server import SolveServer
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Local ODE solve service")
+    parser.add_argument("--host", default="127.0.0.1", help="loopback address to bind to")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=2, help="number of worker processes")
+    parser.add_argument("--queue-size", type=int, default=64, help="maximum number of queued jobs")
+    parser.add_argument("--timeout", type=float, default=30.0, help="default per-job timeout in seconds")
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args()
+
+    manager = JobManager(workers=args.workers, queue_size=args.queue_size, default_timeout=args.timeout)
+    server = SolveServer(manager, host=args.host, port=args.port, verbose=args.verbose)
+    print(f"Serving on http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,409 @@
+from typing import Optional
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from collections import OrderedDict, deque
+import multiprocessing
+import threading
+import itertools
+import queue
+import time
+
+from core import ode_solve_methods, ODESolver, MethodComparator, MethodSelector, parse_equation
+from utils.method_register import ODEMethodRegistry
+
+for method in ode_solve_methods:
+    ODEMethodRegistry.register(method)
+ODEMethodRegistry.register_auto()
+
+
+JOB_TYPES = ("solve", "compare", "analytical")
+# progress queue inherited by each worker process (set by _init_worker)
+_progress_queue = None
+
+
+class QueueFullError(Exception):
+    """Raised when the job queue is at capacity"""
+    pass
+
+
+def _init_worker(progress_queue) -> None:
+    global _progress_queue
+    _progress_queue = progress_queue
+    # sympy takes about a second to import; load it before the first job so no job pays for it
+    import sympy  # noqa: F401
+
+
+def _warm_up() -> None:
+    """No-op job that makes a new pool start its worker (and run _init_worker)"""
+    pass
+
+
+def run_job(job_id: int, kind: str, params: dict) -> dict:
+    """
+    Execute a job inside a worker process.
+    Partial trajectories are pushed to the progress queue as (job_id, method_name, ts, ys),
+    followed by a (job_id, None, None, None) sentinel once the job is over.
+    Timeouts are enforced by JobManager, which kills the worker of a job that overruns.
+    Args:
+        job_id: Id of the job (used to tag partial trajectories).
+        kind: Job type, one of JOB_TYPES.
+        params: Validated job parameters.
+    Returns:
+        JSON-serializable job result.
+    """
+    def push(method_name, ts, ys):
+        if _progress_queue is not None:
+            _progress_queue.put((job_id, method_name, ts.tolist(), ys.tolist()))
+
+    try:
+        if kind == "analytical":
+            analytical = ODESolver.solve_analytical(params["equation"], (params["t0"], params["y0"]))
+            if not analytical:
+                return {"expression": None, "values": None}
+            func, expression = analytical
+            values = None
+            if params.get("t") is not None:
+                values = [float(func(t)) for t in params["t"]]
+            return {"expression": expression, "values": values}
+
+        function = parse_equation(params["equation"], f"job {job_id}")
+        if kind == "solve":
+            # None for the automatic choice, resolved by ODESolver.solve
+            method = ODEMethodRegistry.get_method(params["method"])
+            method_name = method.display_name if method is not None else MethodSelector.display_name
+            stats = {}
+            ts, ys, exec_time = ODESolver.solve(
+                function=function,
+                method=method,
+                epsilon=params["epsilon"],
+                y0=params["y0"], t0=params["t0"], t_end=params["t_end"],
+                max_iter=params.get("max_iter"),
+                on_chunk=lambda c_ts, c_ys: push(method_name, c_ts, c_ys),
+                stats=stats,
+                equation=params["equation"] if params["structured"] else None
+            )
+            return {
+                "method": stats.get("selected_method", method_name),
+                "execution_time": exec_time,
+                "num_points": len(ts),
+                **stats,
+                "ts": ts.tolist(),
+                "ys": ys.tolist()
+            }
+
+        methods = [ODEMethodRegistry.get_method(m) for m in params["methods"]]
+        results = MethodComparator.compare_methods(
+            function, params["epsilon"], params["y0"], params["t0"], params["t_end"],
+            methods, params.get("max_iter"), on_chunk=push
+        )
+        return {
+            name: {
+                "execution_time": result["execution_time"],
+                "num_points": result["num_points"],
+                "rejected_steps": result["rejected_steps"],
+                "rhs_evaluations": result["rhs_evaluations"],
+                "ts": result["solution"][0].tolist(),
+                "ys": result["solution"][1].tolist()
+            }
+            for name, result in results.items()
+        }
+    finally:
+        if _progress_queue is not None:
+            _progress_queue.put((job_id, None, None, None))
+
+
+def validate_job(kind: str, params: dict) -> dict:
+    """
+    Validate and normalize job parameters (raises ValueError if they are not valid).
+    Args:
+        kind: Job type, one of JOB_TYPES.
+        params: Raw parameters from the request.
+    Returns:
+        Normalized parameters.
+    """
+    if kind not in JOB_TYPES:
+        raise ValueError(f"Unknown job type: {kind}")
+    equation = params.get("equation")
+    if not isinstance(equation, str) or not equation.strip():
+        raise ValueError("'equation' must be a non-empty string")
+
+    try:
+        clean = {
+            "equation": equation,
+            "y0": float(params.get("y0", 0.0)),
+            "t0": float(params.get("t0", 0.0)),
+        }
+        if kind == "analytical":
+            t = params.get("t")
+            clean["t"] = None if t is None else [float(v) for v in t]
+            return clean
+
+        clean["t_end"] = float(params["t_end"])
+        clean["epsilon"] = float(params.get("epsilon", 1e-3))
+        max_iter = params.get("max_iter")
+        clean["max_iter"] = None if max_iter is None else int(max_iter)
+    except KeyError as e:
+        raise ValueError(f"Missing parameter: {e.args[0]}")
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid parameter: {e}")
+
+    ODESolver._validate_inputs(clean["y0"], clean["t0"], clean["t_end"], clean["epsilon"])
+    if clean["max_iter"] is not None and clean["max_iter"] <= 0:
+        raise ValueError("max_iter must be positive")
+
+    if kind == "solve":
+        method_ids = [params.get("method", "rungekuttamethod")]
+        is_known = ODEMethodRegistry.is_valid
+    else:
+        # the automatic choice runs one of the methods, so it is not compared on its own
+        method_ids = params.get("methods") or [
+            key for key, _ in ODEMethodRegistry.get_method_choices() if not ODEMethodRegistry.is_auto(key)
+        ]
+        is_known = lambda method_id: ODEMethodRegistry.is_valid(method_id) and not ODEMethodRegistry.is_auto(method_id)
+    for method_id in method_ids:
+        if not is_known(method_id):
+            raise ValueError(f"Unknown method: {method_id}")
+    if kind == "solve":
+        clean["method"] = method_ids[0]
+        clean["structured"] = bool(params.get("structured", True))
+    else:
+        clean["methods"] = list(method_ids)
+    return clean
+
+
+class Job:
+    """State of a single submitted job"""
+    def __init__(self, job_id: int, kind: str, params: dict, timeout: float):
+        self.id = job_id
+        self.kind = kind
+        self.params = params
+        self.timeout = timeout
+        self.status = "queued"
+        self.result: Optional[dict] = None
+        self.error: Optional[str] = None
+        self.chunks: list[dict] = []
+        self.stream_closed = False
+        self.submitted_at = time.monotonic()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.cond = threading.Condition()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("done", "failed", "timeout")
+
+    def add_chunk(self, method_name: str, ts: list, ys: list) -> None:
+        with self.cond:
+            self.chunks.append({"method": method_name, "ts": ts, "ys": ys})
+            self.cond.notify_all()
+
+    def close_stream(self) -> None:
+        with self.cond:
+            self.stream_closed = True
+            self.cond.notify_all()
+
+    def wait_chunks(self, cursor: int, timeout: float) -> tuple[list[dict], bool]:
+        """
+        Wait for chunks after the cursor.
+        Returns:
+            Tuple (new_chunks, closed) where closed is True if no more chunks will arrive.
+        """
+        with self.cond:
+            self.cond.wait_for(lambda: len(self.chunks) > cursor or self.stream_closed, timeout)
+            return self.chunks[cursor:], self.stream_closed and len(self.chunks) <= cursor
+
+    def to_dict(self, with_result: bool = True) -> dict:
+        data = {"id": self.id, "type": self.kind, "status": self.status}
+        if self.error is not None:
+            data["error"] = self.error
+        if with_result and self.result is not None:
+            data["result"] = self.result
+        return data
+
+
+class JobManager:
+    """Bounded job queue served by worker processes (one single-process pool per dispatcher thread)"""
+    def __init__(
+        self,
+        workers: int = 2,
+        queue_size: int = 64,
+        default_timeout: float = 30.0,
+        max_finished_jobs: int = 1000,
+        latency_window: int = 1000
+    ):
+        """
+        Initialize the job queue, the worker pool and the dispatcher threads.
+        Args:
+            workers: Number of worker processes (and jobs running at once).
+            queue_size: Maximum number of jobs waiting to run; submissions beyond it are rejected.
+            default_timeout: Time limit in seconds for jobs that do not set their own.
+            max_finished_jobs: Number of finished jobs kept for result lookups.
+            latency_window: Number of recent jobs used for latency metrics.
+        """
+        if workers <= 0 or queue_size <= 0:
+            raise ValueError("workers and queue_size must be positive")
+        self.workers = workers
+        self.queue_size = queue_size
+        self.default_timeout = default_timeout
+        self.max_finished_jobs = max_finished_jobs
+
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._jobs: OrderedDict[int, Job] = OrderedDict()
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+        self._counters = {"submitted": 0, "rejected": 0, "done": 0, "failed": 0, "timeout": 0}
+        self._running = 0
+        self._queue_waits = deque(maxlen=latency_window)
+        self._run_times = deque(maxlen=latency_window)
+
+        self._ctx = multiprocessing.get_context()
+        self._progress = self._ctx.Queue()
+        # each dispatcher owns its worker, so a job that overruns its timeout can be killed
+        # without affecting the jobs running in other workers
+        # (each dispatcher starts its own worker, see _start_worker)
+        self._pools: list[Optional[ProcessPoolExecutor]] = [None] * workers
+        self._threads = [threading.Thread(target=self._progress_loop, daemon=True)]
+        self._threads += [threading.Thread(target=self._dispatch_loop, args=(i,), daemon=True)
+                          for i in range(workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, kind: str, params: dict, timeout: float = None) -> Job:
+        """
+        Validate and enqueue a job.
+        Raises:
+            ValueError: if parameters are not valid.
+            QueueFullError: if the job queue is at capacity.
+        """
+        clean = validate_job(kind, params)
+        timeout = self.default_timeout if timeout is None else float(timeout)
+        if timeout <= 0:
+            raise ValueError("timeout must be positive")
+
+        job = Job(next(self._ids), kind, clean, timeout)
+        with self._lock:
+            try:
+                self._queue.put_nowait(job)
+            except queue.Full:
+                self._counters["rejected"] += 1
+                raise QueueFullError("Job queue is full")
+            self._counters["submitted"] += 1
+            self._jobs[job.id] = job
+            self._evict_finished()
+        return job
+
+    def get(self, job_id: int) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def metrics(self) -> dict:
+        """Returns queue depth, counters and latency statistics"""
+        with self._lock:
+            return {
+                "queue_depth": self._queue.qsize(),
+                "queue_capacity": self.queue_size,
+                "running": self._running,
+                "workers": self.workers,
+                "jobs": dict(self._counters),
+                "queue_wait": self._latency_stats(self._queue_waits),
+                "run_time": self._latency_stats(self._run_times),
+            }
+
+    def shutdown(self) -> None:
+        for _ in range(self.workers):
+            self._queue.put(None)
+        for pool in self._pools:
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        self._progress.put(None)
+
+    @staticmethod
+    def _latency_stats(samples: deque) -> dict:
+        if not samples:
+            return {"count": 0, "mean": None, "p50": None, "p95": None, "max": None}
+        ordered = sorted(samples)
+        n = len(ordered)
+        return {
+            "count": n,
+            "mean": sum(ordered) / n,
+            "p50": ordered[(n - 1) // 2],
+            "p95": ordered[min(n - 1, int(0.95 * n))],
+            "max": ordered[-1],
+        }
+
+    def _evict_finished(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[:max(0, len(finished) - self.max_finished_jobs)]:
+            del self._jobs[job_id]
+
+    def _progress_loop(self) -> None:
+        while True:
+            item = self._progress.get()
+            if item is None:
+                return
+            job_id, method_name, ts, ys = item
+            job = self.get(job_id)
+            if job is None:
+                continue
+            if method_name is None:
+                job.close_stream()
+            else:
+                job.add_chunk(method_name, ts, ys)
+
+    def _start_worker(self, worker: int) -> None:
+        """Create the pool of a dispatcher and wait until its worker is ready, outside any job's time limit"""
+        pool = ProcessPoolExecutor(
+            max_workers=1, mp_context=self._ctx,
+            initializer=_init_worker, initargs=(self._progress,)
+        )
+        pool.submit(_warm_up).result()
+        self._pools[worker] = pool
+
+    @staticmethod
+    def _kill_pool(pool: ProcessPoolExecutor) -> None:
+        """Terminate the worker process of a pool (its running call cannot be cancelled otherwise)"""
+        for process in list((pool._processes or {}).values()):
+            process.terminate()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def _dispatch_loop(self, worker: int) -> None:
+        self._start_worker(worker)
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            job.started_at = time.monotonic()
+            job.status = "running"
+            with self._lock:
+                self._running += 1
+                self._queue_waits.append(job.started_at - job.submitted_at)
+
+            try:
+                future = self._pools[worker].submit(run_job, job.id, job.kind, job.params)
+                job.result = future.result(timeout=job.timeout)
+                status = "done"
+            except (TimeoutError, FutureTimeoutError):
+                job.error = f"Job exceeded timeout of {job.timeout} s"
+                status = "timeout"
+                # the running call cannot be cancelled, so replace the worker
+                self._kill_pool(self._pools[worker])
+                self._start_worker(worker)
+            except BrokenProcessPool:
+                job.error = "Worker process terminated unexpectedly"
+                status = "failed"
+                self._start_worker(worker)
+            except Exception as e:
+                job.error = str(e)
+                status = "failed"
+
+            job.finished_at = time.monotonic()
+            with self._lock:
+                self._running -= 1
+                self._run_times.append(job.finished_at - job.started_at)
+                self._counters[status] += 1
+            with job.cond:
+                job.status = status
+                job.cond.notify_all()
+            if status != "done":
+                job.close_stream()
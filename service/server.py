@@ -0,0 +1,125 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+import ipaddress
+import socket
+import json
+
+from utils.method_register import ODEMethodRegistry
+from .jobs import JobManager, QueueFullError
+
+
+MAX_BODY_SIZE = 1 << 20
+STREAM_POLL_INTERVAL = 1.0
+
+
+class SolveRequestHandler(BaseHTTPRequestHandler):
+    """
+    JSON API of the solve service:
+        POST /jobs                 submit {"type": "solve"|"compare"|"analytical", "params": {...}, "timeout": s}
+        GET  /jobs/<id>            job status and result
+        GET  /jobs/<id>/stream     partial trajectories as newline-delimited JSON
+        GET  /metrics              queue depth, counters and latency statistics
+        GET  /methods              available methods as (id, name) pairs
+    """
+    server: "SolveServer"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def do_GET(self):
+        parts = [p for p in urlparse(self.path).path.split("/") if p]
+        if parts == ["metrics"]:
+            return self._send_json(200, self.server.manager.metrics())
+        if parts == ["methods"]:
+            return self._send_json(200, ODEMethodRegistry.get_method_choices())
+        if len(parts) in (2, 3) and parts[0] == "jobs":
+            job = self._get_job(parts[1])
+            if job is None:
+                return
+            if len(parts) == 2:
+                return self._send_json(200, job.to_dict())
+            if parts[2] == "stream":
+                return self._stream(job)
+        self._send_json(404, {"error": "Not found"})
+
+    def do_POST(self):
+        if urlparse(self.path).path.rstrip("/") != "/jobs":
+            return self._send_json(404, {"error": "Not found"})
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            if length > MAX_BODY_SIZE:
+                return self._send_json(413, {"error": "Request body too large"})
+            body = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(body, dict):
+                raise ValueError("Request body must be a JSON object")
+            job = self.server.manager.submit(body.get("type", "solve"), body.get("params", {}), body.get("timeout"))
+        except QueueFullError as e:
+            return self._send_json(429, {"error": str(e)}, headers={"Retry-After": "1"})
+        except ValueError as e:
+            return self._send_json(400, {"error": str(e)})
+        self._send_json(202, job.to_dict(with_result=False))
+
+    def _get_job(self, raw_id: str):
+        job = self.server.manager.get(int(raw_id)) if raw_id.isdigit() else None
+        if job is None:
+            self._send_json(404, {"error": f"Unknown job: {raw_id}"})
+        return job
+
+    def _stream(self, job):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+
+        cursor = 0
+        try:
+            while True:
+                chunks, closed = job.wait_chunks(cursor, STREAM_POLL_INTERVAL)
+                for chunk in chunks:
+                    self._write_line(chunk)
+                cursor += len(chunks)
+                if closed:
+                    break
+            with job.cond:
+                job.cond.wait_for(lambda: job.finished, STREAM_POLL_INTERVAL)
+            self._write_line(job.to_dict(with_result=False))
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def _write_line(self, data: dict):
+        self.wfile.write(json.dumps(data).encode() + b"\n")
+        self.wfile.flush()
+
+    def _send_json(self, code: int, data, headers: dict = None):
+        body = json.dumps(data).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class SolveServer(ThreadingHTTPServer):
+    """HTTP server bound to localhost that forwards jobs to a JobManager"""
+    daemon_threads = True
+
+    def __init__(self, manager: JobManager, host: str = "127.0.0.1", port: int = 8765, verbose: bool = False):
+        """
+        Args:
+            manager: Job manager executing submitted jobs.
+            host: Loopback address to bind to.
+            port: Port to listen on (0 picks a free port).
+            verbose: Log every request to stderr.
+        """
+        if not ipaddress.ip_address(socket.gethostbyname(host)).is_loopback:
+            raise ValueError(f"Service must bind to a loopback address, got {host}")
+        self.manager = manager
+        self.verbose = verbose
+        super().__init__((host, port), SolveRequestHandler)
+
+    def server_close(self):
+        super().server_close()
+        self.manager.shutdown()
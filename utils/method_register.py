@@ -1,10 +1,13 @@
 from typing import Optional
-from core import ODEMethodInterface
+from core import ODEMethodInterface, MethodSelector
 
 
 
 class ODEMethodRegistry:
+    # id of the automatic choice; get_method returns None for it, which ODESolver.solve resolves
+    AUTO_METHOD_ID = "auto"
     _methods: dict[str, ODEMethodInterface] = {}
+    _auto_enabled: bool = False
 
     @classmethod
     def register(cls, method_class: ODEMethodInterface) -> ODEMethodInterface:
@@ -13,16 +16,37 @@ class ODEMethodRegistry:
         cls._methods[method_class.__name__.lower()] = method_class
         return method_class
 
+    @classmethod
+    def register_auto(cls) -> None:
+        """Offer the automatic choice (the method predicted to reach epsilon fastest)"""
+        cls._auto_enabled = True
+
+    @classmethod
+    def is_auto(cls, method_id: str) -> bool:
+        return cls._auto_enabled and method_id == cls.AUTO_METHOD_ID
+
+    @classmethod
+    def is_valid(cls, method_id: str) -> bool:
+        return method_id in cls._methods or cls.is_auto(method_id)
+
     @classmethod
     def get_method(cls, method_id: str) -> Optional[ODEMethodInterface]:
-        return cls._methods.get(method_id)
+        """Method cls for an id, None for the automatic choice (raises KeyError for unknown ids)"""
+        if cls.is_auto(method_id):
+            return None
+        if method_id not in cls._methods:
+            raise KeyError(f"Unknown method: {method_id}")
+        return cls._methods[method_id]
 
     @classmethod
     def get_method_choices(cls) -> list[tuple[str, str]]:
-        return [
+        choices = [
             (key, getattr(cls._methods[key], "display_name", key.title()))
             for key in cls._methods
         ]
+        if cls._auto_enabled:
+            choices.append((cls.AUTO_METHOD_ID, MethodSelector.display_name))
+        return choices
     
     @classmethod
     def get_all_methods(cls) -> list[ODEMethodInterface]: